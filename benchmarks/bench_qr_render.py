@@ -0,0 +1,73 @@
+# benchmarks/bench_qr_render.py
+"""Benchmark renderer QR: image factory PIL bawaan qrcode vs rasterizer NumPy master_engine.
+
+Encode dilakukan sekali di luar pengukuran, jadi yang dibandingkan hanya rendering
+matriks -> gambar (+ PNG encode), untuk jalur batch (hitam/putih) dan single (warna, RGBA).
+
+    python benchmarks/bench_qr_render.py --n 500
+"""
+import argparse
+import io
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import qrcode
+
+from master_engine.qr import encode_matrix, render_matrix
+
+STYLES = {
+    "batch (black/white)": dict(fill_color="black", back_color="white", box_size=10, border=4, rgba=False),
+    "single (#1b4f72/#ffffff, RGBA)": dict(fill_color="#1b4f72", back_color="#ffffff", box_size=10, border=4, rgba=True),
+}
+
+
+def _qrcode_objects(payloads, box_size, border):
+    objs = []
+    for data in payloads:
+        qr = qrcode.QRCode(version=1, error_correction=qrcode.constants.ERROR_CORRECT_H, box_size=box_size, border=border)
+        qr.add_data(data)
+        qr.make(fit=True)
+        objs.append(qr)
+    return objs
+
+
+def _timed(fn, items, png: bool):
+    start = time.perf_counter()
+    for item in items:
+        img = fn(item)
+        if png:
+            img.save(io.BytesIO(), format="PNG")
+    return (time.perf_counter() - start) * 1000 / len(items)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--n", type=int, default=300, help="Jumlah payload")
+    parser.add_argument("--png", action="store_true", help="Ikut hitung PNG encode")
+    args = parser.parse_args(argv)
+
+    payloads = [f"https://example.com/badge/{i:06d}?emp=EMP{i:06d}" for i in range(args.n)]
+    matrices = [encode_matrix(p) for p in payloads]
+    for label, style in STYLES.items():
+        rgba = style.pop("rgba")
+        objs = _qrcode_objects(payloads, style["box_size"], style["border"])
+        colors = dict(fill_color=style["fill_color"], back_color=style["back_color"])
+
+        def old(qr):
+            img = qr.make_image(**colors).get_image()
+            return img.convert("RGBA") if rgba else img
+
+        def new(matrix):
+            return render_matrix(matrix, rgba=rgba, **style)
+
+        assert all(old(o).tobytes() == new(m).tobytes() for o, m in zip(objs[:20], matrices[:20])), "output berbeda"
+        old_ms, new_ms = _timed(old, objs, args.png), _timed(new, matrices, args.png)
+        print(f"{label:<32} qrcode {old_ms:7.3f} ms/img   numpy {new_ms:7.3f} ms/img   {old_ms / new_ms:5.1f}x")
+        style["rgba"] = rgba
+
+
+if __name__ == "__main__":
+    main()
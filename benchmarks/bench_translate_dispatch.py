@@ -0,0 +1,55 @@
+# benchmarks/bench_translate_dispatch.py
+"""Benchmark dispatcher terjemahan paralel dengan backend stub ber-state (tanpa jaringan).
+
+Backend `stub` dengan `stateful=True` menaruh teks permintaan di atribut klien seperti
+deep-translator, lalu menunggu `--delay` detik sebelum membacanya kembali. Setiap hasil
+diperiksa terhadap chunk masukannya sendiri (juga isi memori terjemahan), jadi klien yang
+terpakai bersama antar thread langsung gagal di sini.
+
+    python benchmarks/bench_translate_dispatch.py --chunks 200 --workers 8
+"""
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from master_engine.translate import TranslationMemory, make_backend, translate_chunks, translate_pages
+
+
+def _run(chunks, workers, delay):
+    backend = make_backend("stub", "id", "en", delay=delay, stateful=True)
+    start = time.perf_counter()
+    out = translate_chunks(chunks, backend, workers=workers, rate=1e6)
+    elapsed = time.perf_counter() - start
+    wrong = [i for i, (src, res) in enumerate(zip(chunks, out)) if res != f"[en] {src}"]
+    assert not wrong, f"workers={workers}: {len(wrong)} chunk tertukar (mis. #{wrong[0] + 1})"
+    return elapsed
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--chunks", type=int, default=200, help="Jumlah chunk")
+    parser.add_argument("--workers", type=int, default=8, help="Permintaan paralel")
+    parser.add_argument("--delay", type=float, default=0.005, help="Round-trip simulasi (detik)")
+    args = parser.parse_args(argv)
+
+    chunks = [f"Baris ke-{i} hasil pemeriksaan MCU" for i in range(args.chunks)]
+    serial = _run(chunks, 1, args.delay)
+    parallel = _run(chunks, args.workers, args.delay)
+    print(f"{args.chunks} chunk   1 worker {serial:6.2f} s   {args.workers} worker {parallel:6.2f} s   "
+          f"{serial / parallel:5.1f}x   semua hasil cocok")
+
+    memory = TranslationMemory(":memory:")
+    backend = make_backend("stub", "id", "en", delay=args.delay, stateful=True)
+    translate_pages(["\n".join(chunks)], backend, "id", "en", memory=memory, chunk_size=1,
+                    workers=args.workers, rate=1e6)
+    rows = memory._conn.execute("SELECT source, target FROM tm").fetchall()
+    assert len(rows) == len(chunks) and all(target == f"[en] {source}" for source, target in rows), \
+        "memori terjemahan menyimpan terjemahan di bawah segmen yang salah"
+    print(f"memori terjemahan: {len(rows)} segmen, semua terjemahan sesuai sumbernya")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,27 @@
+# master_engine/__init__.py
+"""Engine pemrosesan Master App tanpa UI.
+
+Semua fungsi di sini murni (input bytes/DataFrame, output bytes/dict) sehingga
+bisa dipakai oleh halaman Streamlit di `master_app.py` maupun oleh CLI
+(`python -m master_engine ...`) untuk batch besar di server.
+"""
+import importlib
+
+from .errors import EngineError
+from .capabilities import MissingDependency, available, import_report
+from .archive import ZipStream, ArchiveLimitError, write_zip, iter_zip_members, copy_zip_members, parallel_zip
+from .files import rename_sequential, rename_by_excel, order_by_manifest
+from .pdf import merge_pdf_files, optimise_pdf, split_plan, write_split_zip, reorder_pages, encrypt_pdf, images_to_pdf, write_pdf_images_zip
+from .extract import extract_page_texts, extract_text
+from .image import compress_image, compress_images, rename_images_sequential
+from .qr import build_qr_image, qr_png_bytes, write_batch_qr_zip
+
+# Modul berbasis pandas baru di-import saat pertama dipakai, supaya worker process pool
+# (yang ikut meng-import paket ini) tidak membayar ~0.5 detik import pandas.
+_LAZY = {"read_table": "tabular", "df_to_excel_bytes": "tabular", "organise_by_excel": "mcu", "status_counts": "mcu"}
+
+
+def __getattr__(name):
+    if name in _LAZY:
+        return getattr(importlib.import_module(f".{_LAZY[name]}", __name__), name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -0,0 +1,305 @@
+# master_engine/archive.py
+import copy
+import io
+import os
+import struct
+import time
+import zipfile
+import zlib
+
+from .errors import EngineError
+from .parallel import bounded_map
+from .spool import SPOOL_THRESHOLD, as_download, new_spool
+
+# Format yang isinya sudah terkompresi: deflate hanya membuang CPU, jadi disimpan (ZIP_STORED).
+STORED_EXTENSIONS = frozenset({
+    ".jpg", ".jpeg", ".png", ".webp", ".gif", ".heic",
+    ".pdf", ".docx", ".xlsx", ".pptx",
+    ".zip", ".gz", ".tgz", ".bz2", ".xz", ".7z", ".rar",
+    ".mp3", ".mp4", ".m4a", ".mov", ".avi",
+})
+
+# Batas aman untuk arsip yang diunggah (mencegah zip bomb menjatuhkan worker).
+MAX_MEMBERS = 10000
+MAX_TOTAL_UNCOMPRESSED = 2 * 1024 * 1024 * 1024
+MAX_COMPRESSION_RATIO = 200
+_RATIO_MIN_SIZE = 1024 * 1024
+
+
+class ArchiveLimitError(EngineError):
+    """Arsip melewati batas jumlah member, ukuran, atau rasio kompresi."""
+
+
+def compression_for(name: str) -> int:
+    """Metode kompresi untuk sebuah member: STORED untuk format yang sudah terkompresi, selain itu DEFLATED."""
+    if os.path.splitext(name)[1].lower() in STORED_EXTENSIONS:
+        return zipfile.ZIP_STORED
+    return zipfile.ZIP_DEFLATED
+
+
+def check_archive_limits(zf: zipfile.ZipFile, max_members: int = MAX_MEMBERS,
+                         max_total: int = MAX_TOTAL_UNCOMPRESSED, max_ratio: int = MAX_COMPRESSION_RATIO):
+    """Memvalidasi central directory sebelum apa pun didekompres; ArchiveLimitError jika melewati batas.
+
+    Ukuran yang dideklarasikan ikut membatasi dekompresi karena `zipfile` berhenti membaca
+    setelah `file_size` byte.
+    """
+    infos = zf.infolist()
+    if len(infos) > max_members:
+        raise ArchiveLimitError(f"ZIP berisi {len(infos):,} file (maksimal {max_members:,}).")
+    total = 0
+    for info in infos:
+        total += info.file_size
+        if total > max_total:
+            raise ArchiveLimitError(f"Total ukuran isi ZIP melebihi {max_total // (1024 * 1024):,} MB.")
+        if info.file_size > _RATIO_MIN_SIZE and info.file_size > max_ratio * max(info.compress_size, 1):
+            raise ArchiveLimitError(f"Rasio kompresi '{info.filename}' mencurigakan (kemungkinan zip bomb).")
+    return infos
+
+
+def _strip_zip64_extra(extra: bytes) -> bytes:
+    """Membuang record zip64 (id 0x0001) dari field extra; FileHeader menulis ulang bila perlu."""
+    out, i = b"", 0
+    while i + 4 <= len(extra):
+        tag, size = struct.unpack("<HH", extra[i:i + 4])
+        if tag != 1:
+            out += extra[i:i + 4 + size]
+        i += 4 + size
+    return out
+
+
+def _iter_raw_member(fp, info: zipfile.ZipInfo, chunk_size: int = 1024 * 1024):
+    """Data terkompresi sebuah member apa adanya (setelah local header)."""
+    fp.seek(info.header_offset)
+    header = fp.read(zipfile.sizeFileHeader)
+    if header[:4] != zipfile.stringFileHeader:
+        raise zipfile.BadZipFile(f"Local header rusak: {info.filename}")
+    name_len, extra_len = struct.unpack("<HH", header[26:30])
+    fp.seek(info.header_offset + zipfile.sizeFileHeader + name_len + extra_len)
+    remaining = info.compress_size
+    while remaining > 0:
+        chunk = fp.read(min(chunk_size, remaining))
+        if not chunk:
+            raise zipfile.BadZipFile(f"Data terpotong: {info.filename}")
+        remaining -= len(chunk)
+        yield chunk
+
+
+class ZipStream:
+    """Penulis ZIP bertahap: tools menambahkan member satu per satu dan langsung dikompres ke arsip.
+
+    Tanpa `target`, arsip ditulis ke `SpooledTemporaryFile` yang pindah ke disk setelah
+    `spool_threshold` byte, sehingga memori puncak kira-kira sebesar member terbesar,
+    bukan seluruh payload. `target` bisa berupa path atau file biner yang sudah terbuka.
+    Tanpa `compression`, metode tiap member dipilih oleh `compression_for`.
+
+        with ZipStream() as zs:
+            for name, data in items:
+                zs.add(name, data)
+        st.download_button("Unduh", zs.download(), file_name="hasil.zip")
+    """
+
+    def __init__(self, target=None, spool_threshold: int = SPOOL_THRESHOLD, compression: int = None):
+        self._owns_fh = not hasattr(target, "write")
+        if target is None:
+            self._fh = new_spool(spool_threshold)
+        elif self._owns_fh:
+            self._fh = open(target, "wb")
+        else:
+            self._fh = target
+        self._spooled = target is None
+        self.compression = compression
+        self._zip = zipfile.ZipFile(self._fh, "w", zipfile.ZIP_DEFLATED)
+        self.count = 0
+        self.bytes_in = 0
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def __len__(self):
+        return self.count
+
+    def _compression(self, name: str) -> int:
+        return compression_for(name) if self.compression is None else self.compression
+
+    def _new_info(self, name: str) -> zipfile.ZipInfo:
+        zinfo = zipfile.ZipInfo(name, time.localtime(time.time())[:6])
+        zinfo.compress_type = self._compression(name)
+        zinfo.external_attr = 0o600 << 16
+        return zinfo
+
+    def add(self, name: str, data: bytes):
+        """Menambahkan satu member dari bytes."""
+        self._zip.writestr(name, data, compress_type=self._compression(name))
+        self.count += 1
+        self.bytes_in += len(data)
+
+    def add_file(self, name: str, path: str):
+        """Menambahkan satu member dari file di disk (dibaca bertahap, tidak dimuat penuh)."""
+        self._zip.write(path, name, compress_type=self._compression(name))
+        self.count += 1
+        self.bytes_in += os.path.getsize(path)
+
+    def add_fileobj(self, name: str, fileobj):
+        """Menambahkan satu member dari objek file biner (disalin per blok)."""
+        with self._zip.open(self._new_info(name), "w") as dst:
+            for chunk in iter(lambda: fileobj.read(1024 * 1024), b""):
+                dst.write(chunk)
+                self.bytes_in += len(chunk)
+        self.count += 1
+
+    def add_raw(self, src_fp, info: zipfile.ZipInfo, name: str = None):
+        """Menyalin member dari arsip lain tanpa dekompresi/kompresi ulang.
+
+        `src_fp` adalah file biner arsip sumber dan `info` ZipInfo member-nya; data
+        terkompresi, CRC, dan ukuran dipakai apa adanya.
+        """
+        zinfo = copy.copy(info)
+        if name:
+            zinfo.filename = name
+        zinfo.extra = _strip_zip64_extra(info.extra)
+        self._write_compressed(zinfo, _iter_raw_member(src_fp, info))
+
+    def add_compressed(self, name: str, payload: bytes, crc: int, file_size: int, compress_type: int):
+        """Menambahkan member yang sudah dikompres di luar (mis. oleh thread lain).
+
+        `payload` adalah data raw deflate (atau data asli untuk ZIP_STORED), `crc` dan
+        `file_size` dihitung dari data asli.
+        """
+        zinfo = self._new_info(name)
+        zinfo.compress_type = compress_type
+        zinfo.CRC = crc
+        zinfo.file_size = file_size
+        zinfo.compress_size = len(payload)
+        self._write_compressed(zinfo, (payload,))
+
+    def _write_compressed(self, zinfo: zipfile.ZipInfo, chunks):
+        """Menulis local header + data terkompresi lalu mendaftarkan member ke central directory
+        (langkah yang sama dengan `ZipFile.open(..., "w")`, tanpa kompresi ulang)."""
+        zip64 = zinfo.file_size > zipfile.ZIP64_LIMIT or zinfo.compress_size > zipfile.ZIP64_LIMIT
+        zf = self._zip
+        with zf._lock:
+            zf.fp.seek(zf.start_dir)
+            zinfo.header_offset = zf.fp.tell()
+            zf._writecheck(zinfo)
+            zf._didModify = True
+            zf.fp.write(zinfo.FileHeader(zip64))
+            for chunk in chunks:
+                zf.fp.write(chunk)
+            if zinfo.flag_bits & 0x08:
+                fmt = "<4sLQQ" if zip64 else "<4sLLL"
+                zf.fp.write(struct.pack(fmt, b"PK\x07\x08", zinfo.CRC, zinfo.compress_size, zinfo.file_size))
+            zf.filelist.append(zinfo)
+            zf.NameToInfo[zinfo.filename] = zinfo
+            zf.start_dir = zf.fp.tell()
+        self.count += 1
+        self.bytes_in += zinfo.file_size
+
+    def add_all(self, items):
+        """Menambahkan semua (nama, bytes) dari iterable; mengembalikan jumlah member."""
+        for name, data in items:
+            self.add(name, data)
+        return self.count
+
+    def close(self):
+        """Menulis central directory. Aman dipanggil berulang."""
+        if self._zip.fp is not None:
+            self._zip.close()
+            if self._owns_fh and not self._spooled:
+                self._fh.close()
+
+    def download(self):
+        """Arsip yang sudah ditutup sebagai objek file di posisi 0 untuk `st.download_button`
+        (lihat `spool.as_download`)."""
+        if not self._spooled:
+            raise ValueError("download() hanya tersedia untuk ZipStream tanpa target.")
+        self.close()
+        return as_download(self._fh)
+
+
+# Preset level kompresi untuk ZIP paralel (level zlib).
+COMPRESSION_LEVELS = {"fast": 1, "balanced": 6, "max": 9}
+
+
+def _deflate_member(job):
+    """Worker thread: kompres satu member (zlib melepas GIL, jadi berjalan paralel)."""
+    name, data, level = job
+    crc = zlib.crc32(data)
+    if compression_for(name) == zipfile.ZIP_STORED:
+        return name, data, crc, len(data), zipfile.ZIP_STORED
+    co = zlib.compressobj(level, zlib.DEFLATED, -15)
+    payload = co.compress(data) + co.flush()
+    return name, payload, crc, len(data), zipfile.ZIP_DEFLATED
+
+
+def parallel_zip(items, zs: ZipStream, level: str = "balanced", workers: int = None, progress=None) -> dict:
+    """Mengompres (nama, bytes) dari `items` di thread pool lalu menulisnya ke `zs` sesuai urutan input.
+
+    Satu penulis (thread pemanggil) menambahkan member yang sudah jadi; jumlah member
+    in-flight dibatasi oleh `bounded_map`. `progress(jumlah_file, byte_masuk)` dipanggil per
+    member. Mengembalikan statistik: files, bytes_in, bytes_out, seconds, mb_per_s
+    (throughput data masukan).
+    """
+    zlib_level = COMPRESSION_LEVELS[level]
+    start = time.perf_counter()
+    files = bytes_in = bytes_out = 0
+    jobs = ((name, data, zlib_level) for name, data in items)
+    for name, payload, crc, size, method in bounded_map(_deflate_member, jobs, workers=workers, ordered=True, threads=True):
+        zs.add_compressed(name, payload, crc, size, method)
+        files += 1
+        bytes_in += size
+        bytes_out += len(payload)
+        if progress:
+            progress(files, bytes_in)
+    seconds = time.perf_counter() - start
+    return {
+        "files": files,
+        "bytes_in": bytes_in,
+        "bytes_out": bytes_out,
+        "seconds": seconds,
+        "mb_per_s": bytes_in / (1024 * 1024) / seconds if seconds else 0.0,
+    }
+
+
+def write_zip(target, items) -> int:
+    """Menulis semua (nama, bytes) dari iterable ke ZIP di `target` (path/file); mengembalikan jumlah member."""
+    with ZipStream(target) as zs:
+        return zs.add_all(items)
+
+
+def _as_fileobj(source):
+    return io.BytesIO(source) if isinstance(source, (bytes, bytearray)) else source
+
+
+def iter_zip_members(source):
+    """Menghasilkan (nama_file, data_bytes) untuk setiap file (bukan folder) di ZIP, satu per satu.
+
+    `source` berupa bytes, path, atau file biner; batas `check_archive_limits` diterapkan.
+    """
+    with zipfile.ZipFile(_as_fileobj(source)) as z:
+        for info in check_archive_limits(z):
+            if not info.is_dir():
+                yield info.filename, z.read(info)
+
+
+def copy_zip_members(source, zs: ZipStream) -> int:
+    """Memindahkan semua file (bukan folder) dari ZIP `source` ke `zs` tanpa dekompresi
+    (raw copy). Mengembalikan jumlah member yang disalin."""
+    src = _as_fileobj(source)
+    owned = isinstance(src, (str, os.PathLike))
+    if owned:
+        src = open(src, "rb")
+    try:
+        with zipfile.ZipFile(src) as z:
+            copied = 0
+            for info in check_archive_limits(z):
+                if not info.is_dir():
+                    zs.add_raw(src, info)
+                    copied += 1
+        return copied
+    finally:
+        if owned:
+            src.close()
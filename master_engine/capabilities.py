@@ -0,0 +1,107 @@
+# master_engine/capabilities.py
+"""Registry library opsional yang berat (PyPDF2, pdfplumber, python-docx, pdf2image,
+deep-translator, qrcode, python-calamine, pyarrow).
+
+Ketersediaan dicek murah lewat `importlib.util.find_spec` tanpa meng-import modulnya;
+modul baru di-import saat tool yang membutuhkannya pertama kali berjalan (`load`).
+Waktu import dicatat sehingga `import_report()` bisa menunjukkan biaya startup per worker.
+"""
+import importlib
+import importlib.util
+import shutil
+import subprocess
+import sys
+import time
+
+from .errors import EngineError
+
+
+class MissingDependency(EngineError):
+    """Library opsional untuk sebuah tool tidak terpasang."""
+
+
+# nama -> (modul yang di-import, nama paket pip, pesan jika tidak tersedia)
+CAPABILITIES = {
+    "pypdf2": ("PyPDF2", "PyPDF2", "PyPDF2 tidak terinstall."),
+    "pdfplumber": ("pdfplumber", "pdfplumber", "pdfplumber tidak terinstall."),
+    "docx": ("docx", "python-docx", "Library `python-docx` tidak ditemukan."),
+    "pdf2image": ("pdf2image", "pdf2image", "pdf2image not installed or poppler missing."),
+    "translator": ("deep_translator", "deep-translator", "Library `deep-translator` tidak ditemukan."),
+    "qrcode": ("qrcode", "qrcode[pil]", "Library `qrcode` tidak ditemukan."),
+    "calamine": ("python_calamine", "python-calamine", "python-calamine tidak terinstall (pembaca Excel cepat)."),
+    "pyarrow": ("pyarrow", "pyarrow", "pyarrow tidak terinstall (ekspor Parquet)."),
+}
+
+# Syarat tambahan di luar Python (dicek tanpa import).
+_EXTRA_CHECKS = {
+    "pdf2image": lambda: shutil.which("pdftoppm") is not None,
+}
+
+_available = {}
+_modules = {}
+_import_ms = {}
+
+
+def available(name: str) -> bool:
+    """True jika capability bisa dipakai. Tidak meng-import modulnya."""
+    if name not in _available:
+        module_name = CAPABILITIES[name][0]
+        try:
+            found = importlib.util.find_spec(module_name) is not None
+        except (ImportError, ValueError):
+            found = False
+        check = _EXTRA_CHECKS.get(name)
+        _available[name] = found and (check is None or check())
+    return _available[name]
+
+
+def load(name: str):
+    """Meng-import (sekali) dan mengembalikan modul capability; MissingDependency jika tidak ada."""
+    if name in _modules:
+        return _modules[name]
+    module_name, _, message = CAPABILITIES[name]
+    if not available(name):
+        raise MissingDependency(message)
+    start = time.perf_counter()
+    try:
+        module = importlib.import_module(module_name)
+    except Exception as e:
+        _available[name] = False
+        raise MissingDependency(f"{message} ({e})") from e
+    _import_ms[name] = (time.perf_counter() - start) * 1000
+    _modules[name] = module
+    return module
+
+
+def measure_import_ms(name: str) -> float:
+    """Mengukur biaya import sebuah capability di proses Python baru (cold start),
+    tanpa memuatnya ke proses ini. Mengembalikan None jika import gagal."""
+    module_name = CAPABILITIES[name][0]
+    code = f"import time; t = time.perf_counter(); import {module_name}; print((time.perf_counter() - t) * 1000)"
+    res = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True)
+    if res.returncode != 0:
+        return None
+    return float(res.stdout.strip().splitlines()[-1])
+
+
+def import_report(measure: bool = False) -> list:
+    """Status setiap capability: tersedia, sudah dimuat, dan waktu import (ms).
+
+    `import_ms` adalah waktu import yang benar-benar dibayar proses ini (None jika belum dimuat);
+    dengan `measure=True`, `cold_import_ms` berisi biaya import di proses baru — penghematan
+    startup per worker selama tool tersebut tidak dipakai.
+    """
+    rows = []
+    for name, (module_name, package, _) in CAPABILITIES.items():
+        row = {
+            "capability": name,
+            "package": package,
+            "available": available(name),
+            "loaded": name in _modules,
+            "import_ms": round(_import_ms[name], 1) if name in _import_ms else None,
+        }
+        if measure:
+            cold = measure_import_ms(name) if row["available"] else None
+            row["cold_import_ms"] = round(cold, 1) if cold is not None else None
+        rows.append(row)
+    return rows
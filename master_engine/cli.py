@@ -0,0 +1,321 @@
+# master_engine/cli.py
+"""CLI batch untuk Master App: menjalankan tools engine atas folder file tanpa Streamlit.
+
+Contoh:
+    python -m master_engine merge laporan/ -o gabungan.pdf
+    python -m master_engine organise data_mcu.xlsx laporan/ -o mcu_structured.zip
+"""
+import argparse
+import os
+import sys
+
+import pandas as pd
+
+from . import archive, capabilities, cube, extract, files, image, mcu, pdf, qr, tabular, translate
+from .errors import EngineError
+
+IMAGE_EXTS = (".jpg", ".jpeg", ".png", ".webp")
+
+
+def _collect(paths, exts=None) -> list:
+    """Daftar file dari argumen (file atau folder, tidak rekursif), diurutkan per nama."""
+    found = []
+    for p in paths:
+        if os.path.isdir(p):
+            found.extend(sorted(os.path.join(p, n) for n in os.listdir(p) if os.path.isfile(os.path.join(p, n))))
+        elif os.path.isfile(p):
+            found.append(p)
+        else:
+            raise EngineError(f"File/folder tidak ditemukan: {p}")
+    if exts:
+        found = [f for f in found if f.lower().endswith(exts)]
+    if not found:
+        raise EngineError("Tidak ada file input yang cocok.")
+    return found
+
+
+def _read(path: str) -> bytes:
+    with open(path, "rb") as fh:
+        return fh.read()
+
+
+def _write(path: str, data: bytes):
+    with open(path, "wb") as fh:
+        fh.write(data)
+    print(f"{path} ({len(data):,} bytes)")
+
+
+def _write_zip(path: str, items):
+    count = archive.write_zip(path, items)
+    print(f"{path} ({count} file, {os.path.getsize(path):,} bytes)")
+
+
+def _named(paths):
+    for p in paths:
+        yield os.path.basename(p), _read(p)
+
+
+def _cmd_merge(args):
+    sources = _collect(args.inputs, (".pdf",))
+    if args.order:
+        by_name = {os.path.basename(p): p for p in sources}
+        with open(args.order, "rb") as fh:
+            order, missing, unlisted = files.order_by_manifest(by_name, tabular.read_table(fh.read(), args.order))
+        for name in missing:
+            print(f"  tidak ditemukan: {name}", file=sys.stderr)
+        if unlisted:
+            print(f"  {len(unlisted)} file tidak ada di manifest, ditaruh di akhir", file=sys.stderr)
+        sources = [by_name[n] for n in order]
+    _print_pdf_stats(args.output, pdf.merge_pdf_files(sources, args.output, optimise=args.optimise))
+
+
+def _cmd_optimise(args):
+    _print_pdf_stats(args.output, pdf.optimise_pdf(args.input, args.output))
+
+
+def _print_pdf_stats(path: str, stats: dict):
+    print(f"{path} ({stats['files']} file, {stats['pages']} halaman, {stats['bytes_in']:,} -> {stats['bytes_out']:,} bytes)")
+    if stats["dedup_objects"] or stats["recompressed"]:
+        print(f"  {stats['dedup_objects']} stream duplikat dibuang ({stats['dedup_bytes']:,} bytes), {stats['recompressed']} stream dikompres ulang")
+
+
+def _cmd_split(args):
+    mode = "ranges" if args.ranges else "bookmarks" if args.bookmarks else "every" if args.every else "pages"
+    plan = pdf.split_plan(args.input, mode, every=args.every or 1, ranges=args.ranges)
+    with archive.ZipStream(args.output) as zs:
+        count = pdf.write_split_zip(args.input, plan, zs, workers=args.workers)
+    print(f"{args.output} ({count} file, {os.path.getsize(args.output):,} bytes)")
+
+
+def _cmd_reorder(args):
+    data = _read(args.input)
+    order = pdf.parse_page_order(args.order, pdf.count_pages(data))
+    _write(args.output, pdf.reorder_pages(data, order))
+
+
+def _cmd_images_to_pdf(args):
+    stats = pdf.images_to_pdf(_collect(args.inputs, IMAGE_EXTS), args.output, page_size=args.page_size, fit=args.fit,
+                              margin_mm=args.margin)
+    print(f"{args.output} ({stats['pages']} halaman, {stats['passthrough']} JPEG tanpa kompres ulang, {stats['bytes_out']:,} bytes)")
+
+
+def _cmd_encrypt(args):
+    sources = _collect(args.inputs, (".pdf",))
+    os.makedirs(args.output_dir, exist_ok=True)
+    for p in sources:
+        _write(os.path.join(args.output_dir, os.path.basename(p)), pdf.encrypt_pdf(_read(p), args.password))
+
+
+def _cmd_translate(args):
+    page_texts = extract.extract_page_texts(args.input)
+    if not translate.has_text(page_texts):
+        raise EngineError("Teks kosong atau tidak dapat diekstrak dari PDF.")
+    backend = translate.make_backend(args.backend, args.source, args.target)
+    memory = None if args.no_memory else translate.TranslationMemory(args.memory)
+    parts, stats = translate.translate_pages(page_texts, backend, args.source, args.target, memory=memory,
+                                             workers=args.workers, rate=args.rate, retries=args.retries)
+    _write(args.output, translate.parts_to_docx(parts))
+    print(f"  {stats['segments']} segmen, {stats['unique']} unik, {stats['hits']} dari memori, {stats['requests']} permintaan")
+
+
+def _cmd_compress_images(args):
+    errors, report = {}, []
+    _write_zip(args.output, image.compress_images(_named(_collect(args.inputs, IMAGE_EXTS)), args.quality, args.max_side,
+                                                  errors, report, workers=args.workers, target_kb=args.target_kb))
+    for row in report:
+        print(f"  {row['file']:<40} {row['status']:<10} {row['bytes_in']:>12,} -> {row['bytes_out']:>12,} bytes {row['ms']:>8} ms")
+    for name, msg in errors.items():
+        print(f"Gagal: {name} — {msg}", file=sys.stderr)
+    saved = sum(r["bytes_in"] - r["bytes_out"] for r in report if r["status"] != "gagal")
+    print(f"Total hemat {saved:,} bytes")
+
+
+def _cmd_qr_batch(args):
+    df = tabular.read_table(_read(args.table), args.table)
+    rows = qr.qr_rows_from_df(df, args.data_col, args.name_col, args.prefix)
+    with archive.ZipStream(args.output) as zs:
+        qr.write_batch_qr_zip(rows, zs, workers=args.workers)
+    print(f"{args.output} ({len(zs)} QR)")
+
+
+def _cmd_organise(args):
+    df = tabular.read_table(_read(args.table), args.table, usecols=mcu.ORGANISE_READ_COLUMNS,
+                            categories=["Departemen", "JABATAN", "target_folder"])
+    pdf_map = dict(_named(_collect(args.pdfs, (".pdf",))))
+    report = []
+    _, out_map, not_found = mcu.organise_by_excel(df, pdf_map, report=report)
+    _write_zip(args.output, out_map.items())
+    if not_found:
+        print(f"{len(not_found)} ID/File tidak ditemukan. Contoh: {not_found[:10]}", file=sys.stderr)
+    if report:
+        counts = {}
+        for row in report:
+            counts[row["status"]] = counts.get(row["status"], 0) + 1
+        print("  " + ", ".join(f"{status}: {n}" for status, n in counts.items()))
+        if args.report:
+            _write(args.report, tabular.df_to_excel_bytes(pd.DataFrame(report)))
+
+
+def _cmd_mcu_status(args):
+    counts_by_col, rows = mcu.stream_status_counts(args.table, args.table, chunk_rows=args.chunk_rows)
+    print(f"{args.table} ({rows:,} baris)")
+    for col, counts in counts_by_col.items():
+        print(f"  {col}")
+        for status, n in counts.itertuples(index=False):
+            print(f"    {status:<30} {n:>12,}")
+    if args.output:
+        with pd.ExcelWriter(args.output, engine="openpyxl") as writer:
+            for col, counts in counts_by_col.items():
+                counts.to_excel(writer, sheet_name=col[:31], index=False)
+        print(args.output)
+
+
+def _cmd_mcu_cube(args):
+    paths = _collect(args.inputs, (".csv", ".xlsx"))
+    frames = cube.read_frames((os.path.basename(p), _read(p)) for p in paths)
+    columns = cube.common_columns(frames)
+    status_col = args.status or next(iter(cube.status_columns(frames)), None)
+    if status_col is None:
+        raise EngineError("Kolom yang mengandung kata 'status', 'fit', atau 'hasil' tidak ditemukan.")
+    dims = args.dims.split(",") if args.dims else cube.suggest_dimensions(columns)
+    date_col = args.date_col or cube.suggest_date_column(columns)
+    store = cube.combine_frames(frames, status_col, dims, date_col=date_col, period=args.period)
+    result = cube.build_cube(store, status_col)
+    _write(args.output, cube.cube_to_parquet(result) if args.output.lower().endswith(".parquet") else cube.cube_to_excel(result))
+    print(f"  {len(paths)} file, {len(store):,} baris -> {len(result):,} kombinasi ({', '.join(list(store.columns))})")
+
+
+def _cmd_zip(args):
+    with archive.ZipStream(args.output) as zs:
+        stats = archive.parallel_zip(_named(_collect(args.inputs)), zs, level=args.level, workers=args.workers)
+    print(f"{args.output} ({stats['files']} file, {stats['bytes_in']:,} -> {stats['bytes_out']:,} bytes, "
+          f"{stats['mb_per_s']:.1f} MB/s)")
+
+
+def _cmd_capabilities(args):
+    for row in capabilities.import_report(measure=args.measure):
+        status = "ada" if row["available"] else "TIDAK ADA"
+        cold = f"  cold import {row['cold_import_ms']} ms" if row.get("cold_import_ms") is not None else ""
+        print(f"{row['capability']:<12} {row['package']:<16} {status}{cold}")
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(prog="python -m master_engine", description="Tools Master App (PDF, gambar, QR, MCU, ZIP) tanpa UI.")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    p = sub.add_parser("merge", help="Gabung PDF (urut nama file atau manifest --order)")
+    p.add_argument("inputs", nargs="+", help="File PDF atau folder berisi PDF")
+    p.add_argument("-o", "--output", default="merged.pdf")
+    p.add_argument("--order", help="Excel/CSV berisi urutan file (kolom 'filename' atau kolom pertama)")
+    p.add_argument("--optimise", action="store_true", help="Simpan font/gambar identik sekali dan kompres ulang isi halaman")
+    p.set_defaults(func=_cmd_merge)
+
+    p = sub.add_parser("optimise", help="Optimasi ukuran PDF (deduplikasi + kompres ulang)")
+    p.add_argument("input")
+    p.add_argument("-o", "--output", default="optimised.pdf")
+    p.set_defaults(func=_cmd_optimise)
+
+    p = sub.add_parser("split", help="Pisah PDF per halaman, setiap N halaman, rentang, atau bookmark (ZIP)")
+    p.add_argument("input")
+    p.add_argument("-o", "--output", default="pages.zip")
+    group = p.add_mutually_exclusive_group()
+    group.add_argument("--every", type=int, help="Jumlah halaman per file")
+    group.add_argument("--ranges", help="Rentang halaman, contoh: 1-3,5,8-")
+    group.add_argument("--bookmarks", action="store_true", help="Satu file per bookmark level teratas")
+    p.add_argument("--workers", type=int, default=None, help="Jumlah proses (default: jumlah core)")
+    p.set_defaults(func=_cmd_split)
+
+    p = sub.add_parser("reorder", help="Reorder/hapus halaman PDF")
+    p.add_argument("input")
+    p.add_argument("--order", required=True, help="Urutan halaman baru, mis. \"3,1,2\"")
+    p.add_argument("-o", "--output", default="pdf_reordered.pdf")
+    p.set_defaults(func=_cmd_reorder)
+
+    p = sub.add_parser("images-to-pdf", help="Gabung gambar menjadi PDF (satu halaman per gambar)")
+    p.add_argument("inputs", nargs="+", help="File gambar atau folder berisi gambar")
+    p.add_argument("--page-size", choices=list(pdf.PAGE_SIZES), default="auto", help="auto = sesuai ukuran gambar")
+    p.add_argument("--fit", choices=pdf.FIT_MODES, default="fit")
+    p.add_argument("--margin", type=float, default=0, help="Margin (mm)")
+    p.add_argument("-o", "--output", default="images_as_pdf.pdf")
+    p.set_defaults(func=_cmd_images_to_pdf)
+
+    p = sub.add_parser("encrypt", help="Kunci PDF dengan password")
+    p.add_argument("inputs", nargs="+")
+    p.add_argument("--password", required=True)
+    p.add_argument("-o", "--output-dir", default="encrypted")
+    p.set_defaults(func=_cmd_encrypt)
+
+    p = sub.add_parser("translate", help="Terjemahkan teks PDF ke Word (.docx)")
+    p.add_argument("input")
+    p.add_argument("-o", "--output", default="translated.docx")
+    p.add_argument("--source", default="auto", help="Kode bahasa sumber (default: auto)")
+    p.add_argument("--target", default="en", help="Kode bahasa tujuan (default: en)")
+    p.add_argument("--backend", choices=sorted(translate.BACKENDS), default="google")
+    p.add_argument("--workers", type=int, default=4, help="Permintaan paralel")
+    p.add_argument("--rate", type=float, default=5.0, help="Batas permintaan per detik")
+    p.add_argument("--retries", type=int, default=3)
+    p.add_argument("--memory", help="File SQLite memori terjemahan (default: ~/.master_app/translation_memory.sqlite3)")
+    p.add_argument("--no-memory", action="store_true", help="Jangan pakai memori terjemahan")
+    p.set_defaults(func=_cmd_translate)
+
+    p = sub.add_parser("compress-images", help="Kompres foto (ZIP)")
+    p.add_argument("inputs", nargs="+")
+    p.add_argument("--quality", type=int, default=75)
+    p.add_argument("--max-side", type=int, default=1200)
+    p.add_argument("--target-kb", type=int, help="Ukuran maksimum per file (KB); kualitas/dimensi dicari otomatis")
+    p.add_argument("--workers", type=int, help="Jumlah proses paralel (default: jumlah core)")
+    p.add_argument("-o", "--output", default="foto_kompres.zip")
+    p.set_defaults(func=_cmd_compress_images)
+
+    p = sub.add_parser("qr-batch", help="Batch QR dari CSV/Excel (ZIP)")
+    p.add_argument("table")
+    p.add_argument("--data-col", required=True)
+    p.add_argument("--name-col")
+    p.add_argument("--prefix", default="QR_")
+    p.add_argument("--workers", type=int, help="Jumlah proses paralel (default: jumlah core)")
+    p.add_argument("-o", "--output", default="batch_qr.zip")
+    p.set_defaults(func=_cmd_qr_batch)
+
+    p = sub.add_parser("organise", help="Organise by Excel untuk laporan MCU (ZIP)")
+    p.add_argument("table", help="Excel/CSV (No_MCU, Nama, Departemen, JABATAN) atau (filename, target_folder)")
+    p.add_argument("pdfs", nargs="+", help="File PDF atau folder berisi PDF")
+    p.add_argument("-o", "--output", default="mcu_structured.zip")
+    p.add_argument("--report", help="Simpan laporan pencocokan per baris ke file Excel ini")
+    p.set_defaults(func=_cmd_organise)
+
+    p = sub.add_parser("mcu-status", help="Distribusi kolom status/hasil MCU dari CSV/XLSX besar (streaming)")
+    p.add_argument("table")
+    p.add_argument("--chunk-rows", type=int, default=mcu.STREAM_CHUNK_ROWS, help="Baris CSV per chunk")
+    p.add_argument("-o", "--output", help="Simpan distribusi ke Excel (satu sheet per kolom)")
+    p.set_defaults(func=_cmd_mcu_status)
+
+    p = sub.add_parser("mcu-cube", help="Kubus agregat status MCU dari banyak file (Excel/Parquet)")
+    p.add_argument("inputs", nargs="+", help="File CSV/XLSX atau folder")
+    p.add_argument("--status", help="Kolom status (nama dinormalisasi; default: kolom status pertama)")
+    p.add_argument("--dims", help="Dimensi dipisah koma (default: kolom departemen/jabatan/lokasi)")
+    p.add_argument("--date-col", help="Kolom tanggal untuk periode (default: tebakan, atau tahun di nama file)")
+    p.add_argument("--period", choices=list(cube.PERIOD_FREQS), default="year")
+    p.add_argument("-o", "--output", default="mcu_kubus.xlsx", help=".xlsx atau .parquet")
+    p.set_defaults(func=_cmd_mcu_cube)
+
+    p = sub.add_parser("zip", help="Kompres file ke ZIP")
+    p.add_argument("inputs", nargs="+")
+    p.add_argument("--level", choices=list(archive.COMPRESSION_LEVELS), default="balanced")
+    p.add_argument("--workers", type=int, help="Jumlah thread kompresi (default: jumlah core)")
+    p.add_argument("-o", "--output", default="compressed_files.zip")
+    p.set_defaults(func=_cmd_zip)
+
+    p = sub.add_parser("capabilities", help="Status library opsional dan biaya import-nya")
+    p.add_argument("--measure", action="store_true", help="Ukur waktu import tiap library di proses baru")
+    p.set_defaults(func=_cmd_capabilities)
+    return parser
+
+
+def main(argv=None) -> int:
+    args = build_parser().parse_args(argv)
+    try:
+        args.func(args)
+    except EngineError as e:
+        print(f"Error: {e}", file=sys.stderr)
+        return 1
+    return 0
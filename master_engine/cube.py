@@ -0,0 +1,166 @@
+# master_engine/cube.py
+"""Kubus agregat MCU lintas file (per site/tahun): gabung unggahan, hitung group-by sekali,
+lalu filter/pivot/grafik dibaca dari kubus, bukan dari baris mentah.
+"""
+import io
+import os
+import re
+
+import numpy as np
+import pandas as pd
+from pandas.api.types import union_categoricals
+
+from . import capabilities
+from .errors import EngineError
+from .mcu import STATUS_UNKNOWN, is_status_column, normalise_columns
+
+# Dimensi tambahan yang selalu ada di penyimpanan gabungan.
+PERIOD_COLUMN = "periode"
+SOURCE_COLUMN = "sumber"
+COUNT_COLUMN = "Jumlah"
+PERIOD_FREQS = {"year": "%Y", "month": "%Y-%m"}
+# Potongan nama kolom (sudah dinormalisasi) yang biasanya dimensi / tanggal.
+DIMENSION_HINTS = ("departemen", "dept", "department", "jabatan", "position", "lokasi", "site", "unit")
+DATE_HINTS = ("tanggal", "tgl", "date", "periode")
+
+_YEAR_IN_NAME = re.compile(r"(?<!\d)(19|20)\d{2}(?!\d)")
+
+
+def read_frames(uploads) -> dict:
+    """{nama_file: DataFrame} dari [(nama, bytes)]; kolom dinormalisasi, teks berulang jadi category."""
+    from .tabular import read_table
+
+    frames = {}
+    for name, raw in uploads:
+        frames[name] = normalise_columns(read_table(raw, name, categories="auto"))
+    if not frames:
+        raise EngineError("Tidak ada file data MCU.")
+    return frames
+
+
+def common_columns(frames: dict) -> list:
+    """Kolom yang ada di minimal satu file, urut kemunculan."""
+    return list(dict.fromkeys(c for df in frames.values() for c in df.columns))
+
+
+def status_columns(frames: dict) -> list:
+    return [c for c in common_columns(frames) if is_status_column(c)]
+
+
+def suggest_dimensions(columns) -> list:
+    return [c for c in columns if any(h in c for h in DIMENSION_HINTS) and not is_status_column(c)]
+
+
+def suggest_date_column(columns):
+    return next((c for c in columns if any(h in c for h in DATE_HINTS)), None)
+
+
+def normalise_labels(values) -> pd.Categorical:
+    """Categorical dengan label di-strip + huruf besar (kosong/NaN -> "TIDAK DIKETAHUI").
+
+    Normalisasi dikerjakan pada daftar kategori lalu kode baris dipetakan ulang, jadi biayanya
+    sebanding jumlah label unik, bukan jumlah baris.
+    """
+    cat = values if isinstance(values.dtype, pd.CategoricalDtype) else values.astype("category")
+    labels = pd.Series(cat.cat.categories.astype(str)).str.strip().str.upper().replace("", STATUS_UNKNOWN)
+    new_codes, uniques = pd.factorize(pd.concat([labels, pd.Series([STATUS_UNKNOWN])], ignore_index=True))
+    codes = cat.cat.codes.to_numpy()
+    mapped = new_codes[np.where(codes >= 0, codes, len(labels))]
+    return pd.Categorical.from_codes(mapped, categories=pd.Index(uniques).astype(str))
+
+
+def _constant(value: str, n: int) -> pd.Categorical:
+    return pd.Categorical.from_codes(np.zeros(n, dtype=np.int8), categories=[value])
+
+
+def _parse_dates(values) -> pd.Series:
+    """Tanggal dari nilai unik: ISO (yyyy-mm-dd) apa adanya, selain itu hari lebih dulu (dd/mm/yyyy)."""
+    if pd.api.types.is_datetime64_any_dtype(values):
+        return values
+    text = values.astype("string")
+    iso = text.str.match(r"\s*\d{4}-").fillna(False).astype(bool)
+    dates = pd.Series(pd.NaT, index=values.index, dtype="datetime64[ns]")
+    dates[iso] = pd.to_datetime(text[iso], errors="coerce")
+    dates[~iso] = pd.to_datetime(text[~iso], errors="coerce", dayfirst=True)
+    return dates
+
+
+def _period(df, name: str, date_col: str, freq: str) -> pd.Categorical:
+    """Periode per baris; tanggal di-parse/diformat per nilai unik lalu dipetakan lewat kode."""
+    if date_col and date_col in df.columns:
+        codes, uniques = pd.factorize(df[date_col])
+        labels = _parse_dates(pd.Series(uniques)).dt.strftime(PERIOD_FREQS[freq]).fillna(STATUS_UNKNOWN)
+        label_codes, periods = pd.factorize(pd.concat([labels, pd.Series([STATUS_UNKNOWN])], ignore_index=True))
+        return pd.Categorical.from_codes(label_codes[np.where(codes >= 0, codes, len(labels))],
+                                         categories=pd.Index(periods).astype(str))
+    match = _YEAR_IN_NAME.search(os.path.basename(name))
+    return _constant(match.group(0) if match else STATUS_UNKNOWN, len(df))
+
+
+def combine_frames(frames: dict, status_col: str, dims, date_col: str = None, period: str = "year") -> pd.DataFrame:
+    """Penyimpanan kolumnar gabungan: `dims` + periode + sumber + `status_col`, semuanya category.
+
+    Kolom digabung dengan `union_categoricals` sehingga hasilnya tetap category (bukan object)
+    dan hanya kode yang disalin. Periode diambil dari `date_col` (tahun/bulan menurut `period`),
+    atau dari tahun di nama file jika tidak ada. Label dinormalisasi seperti distribusi status;
+    kolom yang tidak ada di sebuah file bernilai "TIDAK DIKETAHUI".
+    """
+    if period not in PERIOD_FREQS:
+        raise EngineError(f"Periode tidak dikenal: {period}")
+    if not any(status_col in df.columns for df in frames.values()):
+        raise EngineError(f"Kolom status tidak ditemukan: {status_col}")
+    columns = [c for c in dict.fromkeys(list(dims) + [status_col]) if c not in (PERIOD_COLUMN, SOURCE_COLUMN)]
+    parts = []
+    for name, df in frames.items():
+        part = {c: normalise_labels(df[c]) if c in df.columns else _constant(STATUS_UNKNOWN, len(df)) for c in columns}
+        part[PERIOD_COLUMN] = _period(df, name, date_col, period)
+        part[SOURCE_COLUMN] = _constant(name, len(df))
+        parts.append(part)
+    store = {c: union_categoricals([p[c] for p in parts]) for c in columns + [PERIOD_COLUMN, SOURCE_COLUMN]}
+    return pd.DataFrame(store)[[c for c in columns if c != status_col] + [PERIOD_COLUMN, SOURCE_COLUMN, status_col]]
+
+
+def build_cube(store: pd.DataFrame, status_col: str) -> pd.DataFrame:
+    """Group-by sekali atas semua dimensi + status; hanya kombinasi yang ada (observed)."""
+    keys = [c for c in store.columns if c != status_col] + [status_col]
+    return store.groupby(keys, observed=True).size().rename(COUNT_COLUMN).reset_index()
+
+
+def filter_cube(cube: pd.DataFrame, filters: dict = None) -> pd.DataFrame:
+    """Baris kubus yang nilainya ada di `filters` ({dimensi: [nilai]}; list kosong = semua)."""
+    mask = np.ones(len(cube), dtype=bool)
+    for col, values in (filters or {}).items():
+        if values:
+            mask &= cube[col].isin(values).to_numpy()
+    return cube[mask]
+
+
+def pivot_cube(cube: pd.DataFrame, index, columns: str, filters: dict = None, percent: bool = False) -> pd.DataFrame:
+    """Tabel silang dari kubus: `index` (satu/lebih dimensi) x `columns`, jumlah atau persen per baris."""
+    index = [index] if isinstance(index, str) else list(index)
+    data = filter_cube(cube, filters)
+    table = data.pivot_table(index=index, columns=columns, values=COUNT_COLUMN, aggfunc="sum", fill_value=0, observed=True)
+    table.columns = table.columns.astype(str)
+    if percent:
+        table = (table.div(table.sum(axis=1).replace(0, 1), axis=0) * 100).round(1)
+    else:
+        table["Total"] = table.sum(axis=1)
+    return table.reset_index()
+
+
+def cube_to_excel(cube: pd.DataFrame, pivot: pd.DataFrame = None) -> bytes:
+    """Workbook dengan sheet "Kubus" (dan "Pivot" jika diberikan)."""
+    out = io.BytesIO()
+    with pd.ExcelWriter(out, engine="openpyxl") as writer:
+        cube.to_excel(writer, sheet_name="Kubus", index=False)
+        if pivot is not None:
+            pivot.to_excel(writer, sheet_name="Pivot", index=False)
+    return out.getvalue()
+
+
+def cube_to_parquet(cube: pd.DataFrame) -> bytes:
+    """Kubus sebagai Parquet (dimensi tetap category/dictionary); memerlukan pyarrow."""
+    capabilities.load("pyarrow")
+    out = io.BytesIO()
+    cube.to_parquet(out, engine="pyarrow", index=False)
+    return out.getvalue()
@@ -0,0 +1,5 @@
+# master_engine/errors.py
+
+
+class EngineError(Exception):
+    """Kesalahan input/proses yang pesannya aman ditampilkan langsung ke pengguna."""
@@ -0,0 +1,256 @@
+# master_engine/extract.py
+"""Ekstraksi teks PDF per halaman secara paralel dengan cache hasil per halaman.
+
+Cache dikunci oleh hash isi dokumen + nomor halaman, jadi ekstraksi ulang, pindah ke
+Terjemahan PDF, atau mencoba lagi setelah error memakai teks yang sudah ada.
+"""
+import contextlib
+import hashlib
+import io
+import os
+import threading
+from collections import OrderedDict
+
+from . import capabilities, spool
+from .errors import EngineError
+from .parallel import ProgressThrottle, bounded_map, chunked
+
+# Jumlah halaman yang teksnya disimpan di cache (dibuang LRU jika penuh).
+PAGE_CACHE_SIZE = 20000
+PAGES_PER_JOB = 8
+
+
+class PageTextCache:
+    """Cache LRU thread-safe: (hash_dokumen, backend, indeks_halaman) -> teks."""
+
+    def __init__(self, maxsize: int = PAGE_CACHE_SIZE):
+        self.maxsize = maxsize
+        self._data = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key, count: bool = True):
+        with self._lock:
+            if key in self._data:
+                self._data.move_to_end(key)
+                self.hits += count
+                return self._data[key]
+            self.misses += count
+            return None
+
+    def put(self, key, text):
+        with self._lock:
+            self._data[key] = text
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def clear(self):
+        with self._lock:
+            self._data.clear()
+            self.hits = self.misses = 0
+
+    def info(self) -> dict:
+        return {"hits": self.hits, "misses": self.misses, "currsize": len(self._data), "maxsize": self.maxsize}
+
+
+page_cache = PageTextCache()
+
+
+def document_digest(source) -> str:
+    """SHA-256 isi dokumen (path, bytes, atau file biner yang dibaca per blok dari posisi 0)."""
+    if isinstance(source, (bytes, bytearray)):
+        return hashlib.sha256(source).hexdigest()
+    if isinstance(source, (str, os.PathLike)):
+        with open(source, "rb") as fh:
+            return document_digest(fh)
+    h = hashlib.sha256()
+    source.seek(0)
+    for block in iter(lambda: source.read(1024 * 1024), b""):
+        h.update(block)
+    source.seek(0)
+    return h.hexdigest()
+
+
+def _backend() -> str:
+    if capabilities.available("pdfplumber"):
+        return "pdfplumber"
+    if capabilities.available("pypdf2"):
+        return "pypdf2"
+    raise EngineError("PyPDF2 atau pdfplumber tidak terinstall.")
+
+
+# Dokumen yang sedang dibuka per proses worker (dibuka saat tugas pertama datang).
+_worker_doc = {"path": None, "doc": None}
+
+
+def _open_doc(path: str, backend: str):
+    if _worker_doc["path"] != path:
+        _close_doc()
+        if backend == "pdfplumber":
+            doc = capabilities.load("pdfplumber").open(path)
+        else:
+            doc = capabilities.load("pypdf2").PdfReader(path)
+        _worker_doc.update(path=path, doc=doc)
+    return _worker_doc["doc"]
+
+
+def _close_doc():
+    doc = _worker_doc["doc"]
+    if doc is not None and hasattr(doc, "close"):
+        doc.close()
+    _worker_doc.update(path=None, doc=None)
+
+
+def page_count(path: str) -> int:
+    """Jumlah halaman PDF di `path` dengan backend ekstraksi yang tersedia."""
+    backend = _backend()
+    if backend == "pdfplumber":
+        with capabilities.load("pdfplumber").open(path) as doc:
+            return len(doc.pages)
+    return len(capabilities.load("pypdf2").PdfReader(path).pages)
+
+
+def _extract_pages(job) -> list:
+    """Worker: teks untuk sekumpulan indeks halaman dari PDF di `path`."""
+    path, backend, indices = job
+    doc = _open_doc(path, backend)
+    out = []
+    for i in indices:
+        page = doc.pages[i]
+        out.append((i, page.extract_text() or ""))
+        if backend == "pdfplumber":
+            page.flush_cache()
+    return out
+
+
+@contextlib.contextmanager
+def _as_path(source):
+    """Path file untuk `source` (path, bytes, atau file biner); disalin ke disk bila perlu."""
+    if isinstance(source, (str, os.PathLike)):
+        yield source
+        return
+    if isinstance(source, (bytes, bytearray)):
+        source = io.BytesIO(source)
+    with spool.on_disk(source, suffix=".pdf") as path:
+        yield path
+
+
+def extract_page_texts(source, workers: int = None, progress=None, stats: dict = None) -> list:
+    """Teks tiap halaman PDF (pdfplumber jika ada, selain itu PyPDF2), sesuai urutan halaman.
+
+    `source` berupa path, bytes, atau file biner. Halaman yang belum ada di `page_cache`
+    dibagi per `PAGES_PER_JOB` ke process pool; hasil langsung disimpan ke cache begitu
+    datang, jadi percobaan ulang setelah error hanya mengerjakan sisanya. Jika `stats`
+    (dict) diberikan, diisi dengan `pages` dan `cached`.
+    """
+    backend = _backend()
+    digest = document_digest(source)
+    n = page_cache.get((digest, backend, "pages"), count=False)
+    texts = [page_cache.get((digest, backend, i)) for i in range(n)] if n is not None else None
+    if texts is not None and None not in texts:
+        if stats is not None:
+            stats.update(pages=n, cached=n)
+        ProgressThrottle(progress, n).update(n)
+        return texts
+    with _as_path(source) as path:
+        if n is None:
+            n = page_count(path)
+            page_cache.put((digest, backend, "pages"), n)
+            texts = [page_cache.get((digest, backend, i)) for i in range(n)]
+        missing = [i for i, t in enumerate(texts) if t is None]
+        if stats is not None:
+            stats.update(pages=n, cached=n - len(missing))
+        throttle = ProgressThrottle(progress, n)
+        done = n - len(missing)
+        if workers is None and len(missing) <= PAGES_PER_JOB:
+            workers = 1
+        jobs = ((path, backend, chunk) for chunk in chunked(missing, PAGES_PER_JOB))
+        try:
+            for results in bounded_map(_extract_pages, jobs, workers=workers, ordered=True):
+                for i, text in results:
+                    page_cache.put((digest, backend, i), text)
+                    texts[i] = text
+                done += len(results)
+                throttle.update(done)
+        finally:
+            _close_doc()
+    return texts
+
+
+def extract_text(source, **kwargs) -> str:
+    """Teks seluruh dokumen dengan penanda '--- Page N ---' (argumen sama dengan `extract_page_texts`)."""
+    return "\n".join(f"--- Page {i+1} ---\n" + t for i, t in enumerate(extract_page_texts(source, **kwargs)))
+
+
+# Tata letak hasil Ekstrak Tabel: satu sheet per tabel, atau semua tabel di satu sheet.
+TABLE_LAYOUTS = ("per_table", "single")
+
+
+def _extract_tables(job) -> list:
+    """Worker: tabel (list baris) untuk sekumpulan indeks halaman dari PDF di `path`."""
+    path, indices = job
+    doc = _open_doc(path, "pdfplumber")
+    out = []
+    for i in indices:
+        page = doc.pages[i]
+        out.append((i, page.extract_tables()))
+        page.flush_cache()
+    return out
+
+
+def _cell(value):
+    return "" if value is None else str(value).replace("\n", " ").strip()
+
+
+def write_tables_xlsx(source, target, pages: str = None, layout: str = "per_table", workers: int = None,
+                      progress=None) -> dict:
+    """Deteksi tabel pdfplumber per halaman (paralel) dan tulis baris demi baris ke Excel.
+
+    `pages` opsional berupa rentang seperti "1-3, 5, 8-". Workbook dibuat `write_only`, jadi
+    baris langsung dialirkan ke file tanpa DataFrame; `target` berupa path atau file biner.
+    `layout="per_table"` membuat sheet `H{halaman}_T{n}` per tabel, `"single"` menaruh semua
+    tabel di sheet "Tabel" dengan kolom Halaman dan Tabel di depan. Mengembalikan statistik
+    pages, tables, rows.
+    """
+    if layout not in TABLE_LAYOUTS:
+        raise EngineError(f"Layout tabel tidak dikenal: {layout}")
+    capabilities.load("pdfplumber")
+    from openpyxl import Workbook
+    from .pdf import parse_page_ranges
+
+    stats = {"pages": 0, "tables": 0, "rows": 0}
+    wb = Workbook(write_only=True)
+    single = wb.create_sheet("Tabel") if layout == "single" else None
+    if single is not None:
+        single.append(["Halaman", "Tabel"])
+    with _as_path(source) as path:
+        n = page_count(path)
+        indices = range(n) if not pages else dict.fromkeys(i for a, b in parse_page_ranges(pages, n) for i in range(a - 1, b))
+        indices = list(indices)
+        if workers is None and len(indices) <= PAGES_PER_JOB:
+            workers = 1
+        throttle = ProgressThrottle(progress, len(indices))
+        jobs = ((path, chunk) for chunk in chunked(indices, PAGES_PER_JOB))
+        try:
+            for results in bounded_map(_extract_tables, jobs, workers=workers, ordered=True):
+                for i, tables in results:
+                    for k, table in enumerate(tables, 1):
+                        stats["tables"] += 1
+                        if single is not None:
+                            for row in table:
+                                single.append([i + 1, k] + [_cell(c) for c in row])
+                        else:
+                            ws = wb.create_sheet(f"H{i+1}_T{k}")
+                            for row in table:
+                                ws.append([_cell(c) for c in row])
+                        stats["rows"] += len(table)
+                stats["pages"] += len(results)
+                throttle.update(stats["pages"])
+        finally:
+            _close_doc()
+    if not stats["tables"]:
+        raise EngineError("Tidak ada tabel yang terdeteksi pada halaman yang dipilih.")
+    wb.save(target)
+    return stats
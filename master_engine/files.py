@@ -0,0 +1,60 @@
+# master_engine/files.py
+import os
+
+from .errors import EngineError
+
+RENAME_COLUMNS = ['nama_lama', 'nama_baru']
+
+
+def rename_sequential(files, prefix: str, ext: str, start: int = 1):
+    """Ganti nama [(nama, bytes)] menjadi `{prefix}_001{ext}` tanpa mengubah isi file;
+    menghasilkan (nama_baru, bytes) satu per satu."""
+    if not prefix:
+        raise EngineError("Prefix nama file tidak boleh kosong.")
+    for i, (_, data) in enumerate(files, start):
+        yield f"{prefix}_{i:03d}{ext}", data
+
+
+def rename_by_excel(df, file_map: dict, force_ext: str = None, report: list = None):
+    """Ganti nama file berdasarkan kolom `nama_lama`/`nama_baru` (lihat `manifest.plan_manifest`).
+
+    Jika `force_ext` diisi (mis. ".pdf") ekstensi itu ditambahkan bila belum ada;
+    jika tidak, nama baru tanpa ekstensi memakai ekstensi file lama. Jika `report` (list)
+    diberikan, diisi satu dict per baris rekonsiliasi (baris, sumber, file, tujuan, status).
+    Mengembalikan (out_map, not_found).
+    """
+    from . import manifest
+
+    if not all(col in df.columns for col in RENAME_COLUMNS):
+        raise EngineError(f"Excel/CSV wajib memiliki kolom: {', '.join(RENAME_COLUMNS)}")
+    plan = manifest.plan_manifest(df, file_map, *RENAME_COLUMNS, force_ext=force_ext)
+    if report is not None:
+        report.extend(plan.to_dict("records"))
+    return dict(manifest.apply_plan(plan, file_map)), manifest.not_found_names(plan)
+
+
+def order_by_manifest(names, df, column: str = "filename"):
+    """Mengurutkan `names` sesuai daftar file di manifest (kolom `column`, atau kolom pertama).
+
+    Nama di manifest boleh tanpa ekstensi. File yang tidak tercantum ditaruh di akhir sesuai
+    urutan asal. Mengembalikan (urutan, missing, unlisted): `missing` = nama di manifest yang
+    tidak ada filenya, `unlisted` = file yang tidak ada di manifest.
+    """
+    if df is None or df.empty:
+        raise EngineError("Manifest urutan kosong.")
+    col = column if column in df.columns else df.columns[0]
+    names = list(names)
+    lookup = {}
+    for n in names:
+        lookup.setdefault(n, n)
+        lookup.setdefault(os.path.splitext(n)[0], n)
+    ordered, missing, seen = [], [], set()
+    for entry in df[col].dropna().astype(str).str.strip():
+        match = lookup.get(entry)
+        if match is None:
+            missing.append(entry)
+        elif match not in seen:
+            seen.add(match)
+            ordered.append(match)
+    unlisted = [n for n in names if n not in seen]
+    return ordered + unlisted, missing, unlisted
@@ -0,0 +1,206 @@
+# master_engine/image.py
+import io
+import os
+import time
+
+from PIL import Image, ImageOps
+
+from .errors import EngineError
+from .parallel import bounded_map
+
+# Tag EXIF Orientation (0x0112).
+ORIENTATION_TAG = 274
+# Mode target ukuran: rentang kualitas JPEG, batas jumlah encode per gambar, sisi terkecil.
+TARGET_MIN_QUALITY = 30
+TARGET_MAX_QUALITY = 95
+TARGET_MAX_ENCODES = 10
+TARGET_MIN_SIDE = 64
+# Batch sekecil ini dikerjakan di proses sendiri (biaya start process pool lebih besar).
+INLINE_MAX_FILES = 2
+
+RENAME_FORMATS = ["Sama seperti Asli", "JPG", "PNG", "WEBP"]
+
+
+def _needs_recompress(im, max_side: int) -> bool:
+    """False jika gambar sudah <= `max_side` dan tegak (EXIF orientation 1): aslinya boleh dipakai apa adanya."""
+    if max(im.size) > max_side:
+        return True
+    return im.getexif().get(ORIENTATION_TAG, 1) != 1
+
+
+def _prepare(data: bytes, max_side: int):
+    """Decode (draft untuk JPEG), putar sesuai EXIF, perkecil ke `max_side`; hasil RGB."""
+    im = Image.open(io.BytesIO(data))
+    if im.format == "JPEG":
+        im.draft("RGB", (max_side, max_side))
+    im = ImageOps.exif_transpose(im)
+    im.thumbnail((max_side, max_side))
+    return im.convert("RGB")
+
+
+def _encode_jpeg(im, quality: int) -> bytes:
+    buf = io.BytesIO()
+    im.save(buf, format="JPEG", quality=quality, optimize=True)
+    return buf.getvalue()
+
+
+def compress_image(data: bytes, quality: int = 75, max_side: int = 1200) -> bytes:
+    """Memperkecil gambar ke sisi maksimum `max_side` dan menyimpannya sebagai JPEG.
+
+    JPEG di-decode langsung dalam skala kecil (`Image.draft`, 1/2 s.d. 1/8) alih-alih resolusi
+    penuh, lalu diputar sesuai EXIF orientation sebelum diperkecil.
+    """
+    return _encode_jpeg(_prepare(data, max_side), quality)
+
+
+def compress_to_target(data: bytes, target_bytes: int, max_side: int = 1200, min_quality: int = TARGET_MIN_QUALITY,
+                       max_quality: int = TARGET_MAX_QUALITY, max_encodes: int = TARGET_MAX_ENCODES):
+    """JPEG dengan kualitas setinggi mungkin (dan bila perlu dimensi lebih kecil) yang <= `target_bytes`.
+
+    Paling banyak `max_encodes` kali encode: coba `max_quality`; jika terlalu besar coba
+    `min_quality`, perkecil dimensi sebanding akar rasio ukuran selama masih terlalu besar,
+    lalu binary search kualitas di antaranya. Mengembalikan (bytes, kualitas, (lebar, tinggi));
+    jika anggaran encode habis, hasil terkecil yang didapat dikembalikan apa adanya.
+    """
+    im = _prepare(data, max_side)
+    out = _encode_jpeg(im, max_quality)
+    encodes = 1
+    if len(out) <= target_bytes:
+        return out, max_quality, im.size
+    out = _encode_jpeg(im, min_quality)
+    encodes += 1
+    while len(out) > target_bytes:
+        if encodes >= max_encodes or min(im.size) <= TARGET_MIN_SIDE:
+            return out, min_quality, im.size
+        scale = min(0.95, max(0.5, (target_bytes / len(out)) ** 0.5 * 0.95))
+        im = im.resize((max(1, round(im.width * scale)), max(1, round(im.height * scale))), Image.LANCZOS)
+        out = _encode_jpeg(im, min_quality)
+        encodes += 1
+    best, best_q = out, min_quality
+    lo, hi = min_quality + 1, max_quality - 1
+    while lo <= hi and encodes < max_encodes:
+        q = (lo + hi) // 2
+        out = _encode_jpeg(im, q)
+        encodes += 1
+        if len(out) <= target_bytes:
+            best, best_q, lo = out, q, q + 1
+        else:
+            hi = q - 1
+    return best, best_q, im.size
+
+
+def _target_job(job):
+    """Worker mode target ukuran: (nama, bytes, target_bytes, sisi_maks) -> (nama, hasil, laporan)."""
+    name, data, target_bytes, max_side = job
+    start = time.perf_counter()
+    report = {"file": name, "status": "dikompres", "bytes_in": len(data), "bytes_out": 0, "ms": 0.0,
+              "quality": None, "size": None}
+    try:
+        im = Image.open(io.BytesIO(data))
+        if len(data) <= target_bytes and not _needs_recompress(im, max_side):
+            out, report["status"], report["size"] = data, "dilewati", "x".join(map(str, im.size))
+        else:
+            out, report["quality"], size = compress_to_target(data, target_bytes, max_side)
+            report["size"] = "x".join(map(str, size))
+            if len(out) > target_bytes:
+                report["status"] = "melebihi target"
+        report["bytes_out"] = len(out)
+    except Exception as e:
+        out, report["status"], report["error"] = None, "gagal", str(e)
+    report["ms"] = round((time.perf_counter() - start) * 1000, 1)
+    return name, out, report
+
+
+def _compress_job(job):
+    """Worker Kompres Foto: (nama, bytes, kualitas, sisi_maks) -> (nama, hasil, laporan)."""
+    name, data, quality, max_side = job
+    start = time.perf_counter()
+    report = {"file": name, "status": "dikompres", "bytes_in": len(data), "bytes_out": 0, "ms": 0.0}
+    try:
+        im = Image.open(io.BytesIO(data))
+        out = compress_image(data, quality, max_side)
+        if len(out) >= len(data) and not _needs_recompress(im, max_side):
+            out, report["status"] = data, "dilewati"
+        report["bytes_out"] = len(out)
+    except Exception as e:
+        out, report["status"], report["error"] = None, "gagal", str(e)
+    report["ms"] = round((time.perf_counter() - start) * 1000, 1)
+    return name, out, report
+
+
+def compress_images(files, quality: int = 75, max_side: int = 1200, errors: dict = None, report: list = None,
+                    workers: int = None, target_kb: int = None):
+    """Kompres banyak gambar [(nama, bytes)] di process pool; menghasilkan (compressed_nama, bytes)
+    sesuai urutan input.
+
+    Dengan `target_kb`, `quality` diabaikan dan tiap gambar dicari kualitas/dimensi terbesar
+    yang <= target (`compress_to_target`); laporan mendapat kolom quality dan size.
+
+    Setiap gambar di-encode ulang dengan `quality`; jika hasilnya tidak lebih kecil dan aslinya
+    sudah <= `max_side` serta tegak, file asli yang dipakai (status "dilewati"). File yang gagal dilewati
+    dan dicatat di `errors` ({nama: pesan_error}) jika diberikan; `report` (list) diisi satu dict
+    per file: file, status, bytes_in, bytes_out, ms.
+    """
+    if workers is None and hasattr(files, "__len__") and len(files) <= INLINE_MAX_FILES:
+        workers = 1
+    if target_kb:
+        job_fn, jobs = _target_job, ((name, data, int(target_kb * 1024), max_side) for name, data in files)
+    else:
+        job_fn, jobs = _compress_job, ((name, data, quality, max_side) for name, data in files)
+    for name, out, info in bounded_map(job_fn, jobs, workers=workers, ordered=True):
+        if report is not None:
+            report.append(info)
+        if out is None:
+            if errors is not None:
+                errors[name] = info["error"]
+            continue
+        yield f"compressed_{name}", out
+
+
+def convert_image(data: bytes, output_format: str) -> bytes:
+    """Menyimpan ulang gambar ke format PIL (`JPEG`, `PNG`, `WEBP`, ...)."""
+    img = Image.open(io.BytesIO(data))
+    img_io = io.BytesIO()
+    if output_format in ('JPEG', 'JPG'):
+        img.convert("RGB").save(img_io, format='JPEG', quality=95)
+    elif output_format == 'PNG':
+        img.save(img_io, format='PNG')
+    elif output_format == 'WEBP':
+        img.save(img_io, format='WEBP')
+    else:
+        img.save(img_io, format=output_format)
+    return img_io.getvalue()
+
+
+def _convert_job(job):
+    """Worker Batch Rename: (nama_baru, bytes, format_PIL) -> (nama_baru, bytes_hasil).
+
+    Gambar yang formatnya sudah sama dengan tujuan disalin apa adanya (tanpa encode ulang).
+    """
+    new_name, data, fmt = job
+    with Image.open(io.BytesIO(data)) as im:
+        if im.format == fmt:
+            return new_name, data
+    return new_name, convert_image(data, fmt)
+
+
+def rename_images_sequential(files, prefix: str, new_format: str = "Sama seperti Asli", start: int = 1,
+                             workers: int = None):
+    """Ganti nama [(nama, bytes)] menjadi `{prefix}_001.ext`, opsional sekaligus konversi format;
+    menghasilkan (nama_baru, bytes) satu per satu sesuai urutan input.
+
+    "Sama seperti Asli" menyalin bytes asli tanpa membuka gambar sama sekali. Konversi format
+    dikerjakan di process pool; file yang sudah berformat tujuan juga disalin apa adanya.
+    """
+    if not prefix:
+        raise EngineError("Prefix nama file tidak boleh kosong.")
+    if new_format == "Sama seperti Asli":
+        for i, (name, data) in enumerate(files, start):
+            yield f"{prefix}_{i:03d}{os.path.splitext(name)[1]}", data
+        return
+    output_ext = "." + new_format.lower()
+    fmt = "JPEG" if new_format.upper() in ("JPG", "JPEG") else new_format.upper()
+    if workers is None and hasattr(files, "__len__") and len(files) <= INLINE_MAX_FILES:
+        workers = 1
+    jobs = ((f"{prefix}_{i:03d}{output_ext}", data, fmt) for i, (_, data) in enumerate(files, start))
+    yield from bounded_map(_convert_job, jobs, workers=workers, ordered=True)
@@ -0,0 +1,114 @@
+# master_engine/manifest.py
+"""Pencocokan manifest Excel/CSV dengan file yang diunggah, dipakai semua rename/organise berbasis Excel.
+
+Nama dinormalisasi (Unicode NFC, spasi tepi dibuang, huruf besar/kecil diabaikan) lalu
+manifest di-join dengan daftar file dalam satu `merge` pandas; hasilnya rencana per baris
+(`plan_manifest`) yang sekaligus menjadi sheet rekonsiliasi.
+"""
+import os
+
+import pandas as pd
+
+from .errors import EngineError
+
+# Status baris rencana/rekonsiliasi.
+STATUS_OK = "cocok"
+STATUS_NOT_FOUND = "tidak ditemukan"
+STATUS_EMPTY = "nama kosong"
+STATUS_COLLISION = "nama tujuan bentrok"
+STATUS_DUPLICATE = "baris duplikat"
+STATUS_UNUSED = "file tidak ada di manifest"
+
+PLAN_COLUMNS = ["baris", "sumber", "file", "tujuan", "status"]
+
+
+def normalise_names(values) -> pd.Series:
+    """Kunci pencocokan: teks NFC tanpa spasi tepi, huruf kecil (casefold); NaN menjadi ""."""
+    return (pd.Series(values, dtype="string").str.normalize("NFC").str.strip().str.casefold().fillna("")
+            .astype(object))
+
+
+def _text(values) -> pd.Series:
+    return pd.Series(values, dtype="string").str.normalize("NFC").str.strip().fillna("").astype(object)
+
+
+def _safe_folder(values) -> pd.Series:
+    return values.str.replace(r"[/\\]", "_", regex=True)
+
+
+def _file_keys(names) -> pd.DataFrame:
+    """Tabel kunci file: nama lengkap dulu, lalu nama tanpa ekstensi (kunci pertama yang menang)."""
+    names = pd.Series(list(names), dtype=object)
+    stems = names.map(lambda n: os.path.splitext(n)[0])
+    return pd.concat([
+        pd.DataFrame({"key": normalise_names(names), "file": names}),
+        pd.DataFrame({"key": normalise_names(stems), "file": names}),
+    ], ignore_index=True).drop_duplicates("key", keep="first")
+
+
+def plan_manifest(df, names, source_col: str, target_col: str, folder: bool = False, force_ext: str = None) -> pd.DataFrame:
+    """Rencana rename/organise: satu baris per baris manifest + satu per file yang tidak tercantum.
+
+    `source_col` berisi nama file yang diunggah (boleh tanpa ekstensi, huruf besar/kecil bebas).
+    Tujuan: `folder=True` -> `{target_col}/{nama_file}` (organise), selain itu nama baru dari
+    `target_col` dengan ekstensi `force_ext` ditambahkan bila belum ada, atau ekstensi file
+    lama jika nama baru tidak berekstensi. Tujuan yang sama (tanpa beda huruf besar/kecil)
+    hanya dipakai baris pertama; baris sumber+tujuan yang persis sama ditandai duplikat.
+
+    Kolom hasil: baris (nomor baris di Excel), sumber, file, tujuan, status.
+    """
+    missing_cols = [c for c in (source_col, target_col) if c not in df.columns]
+    if missing_cols:
+        raise EngineError(f"Excel/CSV wajib memiliki kolom: {', '.join(missing_cols)}")
+    plan = pd.DataFrame({
+        "baris": pd.RangeIndex(len(df)) + 2,
+        "sumber": _text(df[source_col]).to_numpy(),
+        "target": _text(df[target_col]).to_numpy(),
+    })
+    plan["key"] = normalise_names(plan["sumber"])
+    plan = plan.merge(_file_keys(names), on="key", how="left")
+    found = plan["file"].notna()
+    file_ext = plan["file"].fillna("").map(lambda n: os.path.splitext(n)[1])
+    if folder:
+        plan["tujuan"] = _safe_folder(plan["target"]) + "/" + plan["file"].fillna("")
+    elif force_ext:
+        has_ext = plan["target"].str.lower().str.endswith(force_ext.lower())
+        plan["tujuan"] = plan["target"].where(has_ext, plan["target"] + force_ext)
+    else:
+        no_ext = plan["target"].map(lambda n: not os.path.splitext(n)[1])
+        plan["tujuan"] = plan["target"].where(~no_ext, plan["target"] + file_ext)
+
+    empty = (plan["key"] == "") | (plan["target"] == "")
+    duplicate = plan.duplicated(["key", "target"]) & found & ~empty
+    target_key = normalise_names(plan["tujuan"])
+    ok = found & ~empty & ~duplicate
+    collision = ok & target_key.where(ok).duplicated()
+    status = pd.Series(STATUS_OK, index=plan.index, dtype=object)
+    status[~found] = STATUS_NOT_FOUND
+    status[empty] = STATUS_EMPTY
+    status[duplicate] = STATUS_DUPLICATE
+    status[collision] = STATUS_COLLISION
+    plan["status"] = status
+    plan.loc[plan["status"] != STATUS_OK, "tujuan"] = ""
+    plan["file"] = plan["file"].fillna("")
+
+    # File dari baris duplikat/bentrok sudah dilaporkan di baris itu, jadi bukan "tidak ada di manifest".
+    listed = set(plan.loc[found, "file"])
+    unused = [n for n in names if n not in listed]
+    plan = plan[PLAN_COLUMNS].astype({"baris": "Int64"})
+    if not unused:
+        return plan
+    extra = pd.DataFrame({"baris": pd.array([pd.NA] * len(unused), dtype="Int64"), "sumber": "", "file": unused,
+                          "tujuan": "", "status": STATUS_UNUSED})
+    return pd.concat([plan, extra[PLAN_COLUMNS]], ignore_index=True)
+
+
+def apply_plan(plan, file_map: dict):
+    """Pasangan (tujuan, bytes) untuk baris berstatus cocok, sesuai urutan manifest."""
+    ok = plan[plan["status"] == STATUS_OK]
+    for target, name in zip(ok["tujuan"].tolist(), ok["file"].tolist()):
+        yield target, file_map[name]
+
+
+def not_found_names(plan) -> list:
+    return plan.loc[plan["status"] == STATUS_NOT_FOUND, "sumber"].tolist()
@@ -0,0 +1,257 @@
+# master_engine/mcu.py
+import os
+import re
+from bisect import bisect_left, bisect_right
+from collections import Counter
+
+import pandas as pd
+
+from . import manifest
+from .errors import EngineError
+from .parallel import ProgressThrottle
+
+ORGANISE_COLUMNS = ["No_MCU", "Nama", "Departemen", "JABATAN"]
+MODE_ID = "id"
+MODE_FILENAME = "filename"
+# Kolom yang dibaca dari Excel Organise by Excel (kedua mode).
+ORGANISE_READ_COLUMNS = ORGANISE_COLUMNS + [MODE_FILENAME, "target_folder"]
+# Status baris di laporan pencocokan Organise by Excel.
+MATCH_OK = manifest.STATUS_OK
+MATCH_NOT_FOUND = manifest.STATUS_NOT_FOUND
+MATCH_AMBIGUOUS = "ambigu"
+MATCH_DUPLICATE = "ID duplikat"
+MATCH_EMPTY = "ID kosong"
+MATCH_UNUSED = "file tidak terpakai"
+# Label distribusi status untuk nilai kosong/NaN.
+STATUS_UNKNOWN = "TIDAK DIKETAHUI"
+# Mode streaming Dashboard MCU: jumlah baris CSV per chunk.
+STREAM_CHUNK_ROWS = 200_000
+
+
+def safe_folder_name(value, default: str) -> str:
+    """Nama folder aman untuk ZIP: tanpa '/' atau '\\', default jika kosong/NaN."""
+    if pd.isna(value):
+        return default
+    return str(value).strip().replace('/', '_').replace('\\', '_')
+
+
+def detect_organise_mode(df) -> str:
+    """Menentukan mode Organise by Excel dari kolom yang tersedia."""
+    if all(c in df.columns for c in ORGANISE_COLUMNS):
+        return MODE_ID
+    if "filename" in df.columns and "target_folder" in df.columns:
+        return MODE_FILENAME
+    raise EngineError("Format Excel/CSV tidak valid.")
+
+
+class PrefixIndex:
+    """Indeks nama file terurut untuk pencarian prefix O(log n) dengan `bisect`."""
+
+    def __init__(self, names):
+        self.names = sorted(names)
+
+    def matches(self, prefix: str) -> list:
+        """Semua nama yang diawali `prefix` (urut)."""
+        lo = bisect_left(self.names, prefix)
+        hi = bisect_right(self.names, prefix + "\U0010ffff", lo)
+        return self.names[lo:hi]
+
+    def lookup(self, prefix: str):
+        """(nama, kandidat): nama unik untuk `prefix`, atau None jika tidak ada/ambigu.
+
+        Jika beberapa file diawali `prefix`, yang dipilih adalah satu-satunya file yang
+        prefix-nya berhenti di batas kata (mis. "MCU1" cocok dengan "MCU1_Budi.pdf" atau
+        "MCU1.pdf", bukan "MCU10_Ani.pdf"); lebih dari satu berarti ambigu.
+        """
+        found = self.matches(prefix)
+        if len(found) > 1:
+            exact = [n for n in found if not n[len(prefix):len(prefix) + 1].isalnum()]
+            if len(exact) == 1:
+                return exact[0], found
+        return (found[0] if len(found) == 1 else None), found
+
+
+def _id_series(values) -> pd.Series:
+    """Kolom ID sebagai teks tanpa spasi tepi; angka bulat dari Excel (123.0) menjadi "123"."""
+    if pd.api.types.is_float_dtype(values):
+        values = values.map(lambda v: v if pd.isna(v) else f"{v:.0f}" if float(v).is_integer() else str(v))
+    return values.astype("string").str.strip().fillna("")
+
+
+def _folder_series(values, default: str) -> pd.Series:
+    """`safe_folder_name` untuk satu kolom sekaligus (kosong/NaN -> `default`)."""
+    values = values.astype("string").str.strip().str.replace(r"[/\\]", "_", regex=True)
+    return values.mask(values.isna() | (values == ""), default)
+
+
+def _organise_by_id(df, pdf_map: dict, report):
+    ids = _id_series(df["No_MCU"])
+    folders = (_folder_series(df["Departemen"], "Unknown_Dept") + "/" + _folder_series(df["JABATAN"], "Unknown_JABATAN")).tolist()
+    index = PrefixIndex(pdf_map)
+    found = {no: index.lookup(no) for no in ids.unique() if no}
+    # Satu file hanya untuk satu ID: ID terpanjang (paling spesifik) yang mendapatkannya.
+    owner = {}
+    for no, (name, _) in found.items():
+        if name is not None and len(no) > len(owner.get(name, "")):
+            owner[name] = no
+    duplicated = ids.duplicated().tolist()
+    out_map, not_found, used = {}, [], set()
+    for no, folder, dup in zip(ids.tolist(), folders, duplicated):
+        name, candidates = found.get(no, (None, []))
+        if not no:
+            status = MATCH_EMPTY
+        elif dup:
+            status = MATCH_DUPLICATE
+        elif name is not None and owner[name] != no:
+            status, candidates = MATCH_AMBIGUOUS, [name]
+        elif name is not None:
+            status = MATCH_OK
+            out_map[f"{folder}/{name}"] = pdf_map[name]
+            used.add(name)
+        elif candidates:
+            status = MATCH_AMBIGUOUS
+        else:
+            status = MATCH_NOT_FOUND
+            not_found.append(no)
+        if report is not None:
+            report.append({"No_MCU": no, "folder": folder, "file": name if status == MATCH_OK else "",
+                           "status": status, "kandidat": ", ".join(candidates[:5]) if status == MATCH_AMBIGUOUS else ""})
+    if report is not None:
+        report.extend({"No_MCU": "", "folder": "", "file": n, "status": MATCH_UNUSED, "kandidat": ""}
+                      for n in pdf_map if n not in used)
+    return out_map, not_found
+
+
+def organise_by_excel(df, pdf_map: dict, report: list = None):
+    """Menyusun PDF ke folder `Departemen/JABATAN/` (berdasarkan prefix No_MCU)
+    atau `target_folder/` (berdasarkan nama file persis).
+
+    Mode No_MCU memakai `PrefixIndex` atas nama file; ID yang cocok ke beberapa file tanpa
+    satu pun yang pas di batas kata, atau yang file-nya juga cocok dengan ID lebih panjang
+    (mis. "M1" vs "M12" untuk "M12.pdf"), dianggap ambigu dan tidak dimasukkan ke ZIP. Mode
+    filename memakai `manifest.plan_manifest`. Jika `report` (list) diberikan, diisi satu dict
+    per baris Excel ditambah file PDF yang tidak terpakai (kolom sesuai mode).
+
+    Mengembalikan (mode, out_map, not_found).
+    """
+    mode = detect_organise_mode(df)
+    if mode == MODE_ID:
+        out_map, not_found = _organise_by_id(df, pdf_map, report)
+        return mode, out_map, not_found
+    plan = manifest.plan_manifest(df, pdf_map, "filename", "target_folder", folder=True)
+    if report is not None:
+        report.extend(plan.to_dict("records"))
+    return mode, dict(manifest.apply_plan(plan, pdf_map)), manifest.not_found_names(plan)
+
+
+def normalise_column_name(name) -> str:
+    """Nama kolom seragam: hanya huruf/angka/_ dan huruf kecil."""
+    return re.sub('[^A-Za-z0-9_]+', '', str(name)).lower()
+
+
+def normalise_columns(df):
+    """Menyeragamkan nama kolom (lihat `normalise_column_name`)."""
+    df.columns = df.columns.str.replace('[^A-Za-z0-9_]+', '', regex=True).str.lower()
+    return df
+
+
+def is_status_column(name: str) -> bool:
+    return 'status' in name or 'fit' in name or 'hasil' in name
+
+
+def find_status_columns(df) -> list:
+    """Kolom kandidat status/hasil MCU."""
+    return [col for col in df.columns if is_status_column(col)]
+
+
+def _counts_frame(label_counts, status_col: str):
+    """DataFrame [status, Jumlah] dari pasangan (label_asli, jumlah).
+
+    Normalisasi (strip + huruf besar, kosong/NaN -> "TIDAK DIKETAHUI") dikerjakan per label
+    unik, bukan per baris.
+    """
+    merged = Counter()
+    for label, n in label_counts:
+        if n:
+            key = "" if label is None or pd.isna(label) else str(label).strip().upper()
+            merged[key or STATUS_UNKNOWN] += int(n)
+    return pd.DataFrame(merged.most_common(), columns=[status_col, 'Jumlah'])
+
+
+def status_counts(df, status_col: str):
+    """Distribusi nilai status (dinormalisasi huruf besar) sebagai DataFrame [status, Jumlah]."""
+    return _counts_frame(df[status_col].value_counts(dropna=False).items(), status_col)
+
+
+def _count_csv(source, chunk_rows: int, progress):
+    header = pd.read_csv(source, nrows=0).columns
+    source.seek(0)
+    picked = {c: normalise_column_name(c) for c in header if is_status_column(normalise_column_name(c))}
+    if not picked:
+        return {}, 0
+    counters = {c: Counter() for c in picked}
+    total = source.seek(0, os.SEEK_END)
+    source.seek(0)
+    throttle = ProgressThrottle(progress, total)
+    rows = 0
+    for chunk in pd.read_csv(source, usecols=list(picked), dtype="category", chunksize=chunk_rows):
+        for c in picked:
+            counters[c].update(dict(chunk[c].value_counts(dropna=False).items()))
+        rows += len(chunk)
+        throttle.update(min(source.tell(), total - 1))
+    throttle.update(total)
+    return {picked[c]: counters[c] for c in picked}, rows
+
+
+def _count_excel(source, progress):
+    from openpyxl import load_workbook
+
+    wb = load_workbook(source, read_only=True, data_only=True)
+    try:
+        ws = wb.active
+        rows_iter = ws.iter_rows(values_only=True)
+        header = next(rows_iter, None) or ()
+        picked = [(i, normalise_column_name(c)) for i, c in enumerate(header)
+                  if c is not None and is_status_column(normalise_column_name(c))]
+        if not picked:
+            return {}, 0
+        counters = [Counter() for _ in picked]
+        throttle = ProgressThrottle(progress, max((ws.max_row or 1) - 1, 1))
+        rows = 0
+        for row in rows_iter:
+            for (i, _), counter in zip(picked, counters):
+                counter[row[i] if i < len(row) else None] += 1
+            rows += 1
+            if rows % 10000 == 0:
+                throttle.update(rows)
+        throttle.update(throttle.total)
+        return {name: counter for (_, name), counter in zip(picked, counters)}, rows
+    finally:
+        wb.close()
+
+
+def stream_status_counts(source, filename: str, chunk_rows: int = STREAM_CHUNK_ROWS, progress=None):
+    """Distribusi semua kolom status tanpa memuat seluruh tabel; mengembalikan ({kolom: DataFrame}, jumlah_baris).
+
+    CSV dibaca per `chunk_rows` baris dan hanya kolom status (dtype category); Excel dibaca
+    baris demi baris lewat openpyxl read-only. Per kolom hanya disimpan hitungan per label
+    asli, jadi memori tetap datar berapa pun jumlah barisnya. Nama kolom di hasil sudah
+    dinormalisasi (`normalise_column_name`). `source` berupa path atau file biner.
+    """
+    name = filename.lower()
+    owns = isinstance(source, (str, os.PathLike))
+    fh = open(source, "rb") if owns else source
+    try:
+        fh.seek(0)
+        if name.endswith((".csv", ".txt")):
+            counters, rows = _count_csv(fh, chunk_rows, progress)
+        elif name.endswith(".xlsx"):
+            counters, rows = _count_excel(fh, progress)
+        else:
+            raise EngineError(f"Mode streaming hanya untuk CSV/XLSX: {filename}")
+    finally:
+        if owns:
+            fh.close()
+    if not counters:
+        raise EngineError("Kolom yang mengandung kata 'status', 'fit', atau 'hasil' tidak ditemukan.")
+    return {col: _counts_frame(counter.items(), col) for col, counter in counters.items()}, rows
@@ -0,0 +1,94 @@
+# master_engine/parallel.py
+"""Helper eksekusi paralel dengan jumlah tugas in-flight yang dibatasi.
+
+Dipakai tools batch (QR, split PDF, ekstraksi, kompres foto, ...) agar memori tetap datar:
+tugas baru hanya dikirim ke pool setelah ada yang selesai.
+"""
+import concurrent.futures as cf
+import multiprocessing
+import os
+import time
+from collections import deque
+
+
+def default_workers() -> int:
+    """Jumlah worker default: jumlah core CPU."""
+    return os.cpu_count() or 1
+
+
+def chunked(items, size: int):
+    """Memecah iterable menjadi list berukuran `size`."""
+    chunk = []
+    for item in items:
+        chunk.append(item)
+        if len(chunk) >= size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+
+def _make_executor(workers: int, threads: bool, initializer, initargs):
+    if threads:
+        return cf.ThreadPoolExecutor(max_workers=workers, initializer=initializer, initargs=initargs)
+    # "spawn" aman dipakai dari server Streamlit yang multi-thread (fork bisa deadlock).
+    return cf.ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context("spawn"),
+                                  initializer=initializer, initargs=initargs)
+
+
+def bounded_map(fn, items, workers: int = None, window: int = None, ordered: bool = False,
+                threads: bool = False, initializer=None, initargs=()):
+    """Menjalankan `fn(item)` untuk setiap item secara paralel dan meng-yield hasilnya.
+
+    Paling banyak `window` tugas berjalan/antre sekaligus (default 4x jumlah worker).
+    `ordered=True` meng-yield sesuai urutan input; selain itu sesuai urutan selesai.
+    `workers=1` menjalankan semuanya di proses ini tanpa pool. `fn` harus fungsi level
+    modul (bisa di-pickle) jika memakai process pool.
+    """
+    workers = workers or default_workers()
+    if workers <= 1:
+        if initializer:
+            initializer(*initargs)
+        for item in items:
+            yield fn(item)
+        return
+    window = max(window or workers * 4, workers)
+    items = iter(items)
+    with _make_executor(workers, threads, initializer, initargs) as executor:
+        if ordered:
+            pending = deque()
+            for item in items:
+                pending.append(executor.submit(fn, item))
+                if len(pending) >= window:
+                    yield pending.popleft().result()
+            while pending:
+                yield pending.popleft().result()
+            return
+        pending = set()
+        for item in items:
+            pending.add(executor.submit(fn, item))
+            if len(pending) >= window:
+                done, pending = cf.wait(pending, return_when=cf.FIRST_COMPLETED)
+                for fut in done:
+                    yield fut.result()
+        for fut in cf.as_completed(pending):
+            yield fut.result()
+
+
+class ProgressThrottle:
+    """Meneruskan update progress `callback(selesai, total)` paling sering sekali per `interval` detik
+    (update terakhir selalu diteruskan), supaya UI tidak di-render ulang untuk setiap item."""
+
+    def __init__(self, callback, total: int, interval: float = 0.25):
+        self.callback = callback
+        self.total = total
+        self.interval = interval
+        self._last = 0.0
+
+    def update(self, done: int):
+        if not self.callback:
+            return
+        now = time.monotonic()
+        if done >= self.total or now - self._last >= self.interval:
+            self._last = now
+            self.callback(done, self.total)
@@ -0,0 +1,618 @@
+# master_engine/pdf.py
+import hashlib
+import io
+import os
+import re
+import tempfile
+import zlib
+from collections import deque
+
+from PIL import Image, ImageOps
+
+from . import capabilities
+from .errors import EngineError
+from .parallel import ProgressThrottle, bounded_map, default_workers
+from .pdfwriter import IncrementalPdfWriter
+
+
+def _pypdf2():
+    return capabilities.load("pypdf2")
+
+
+def _writer_bytes(writer) -> bytes:
+    buf = io.BytesIO()
+    writer.write(buf)
+    return buf.getvalue()
+
+
+def try_encrypt(writer, password: str):
+    """Fungsi untuk enkripsi PDF, menampung try/except"""
+    try:
+        writer.encrypt(password)
+    except TypeError:
+        try:
+            writer.encrypt(user_pwd=password, owner_pwd=None)
+        except Exception:
+            writer.encrypt(user_pwd=password, owner_pwd=password)
+
+
+def rotate_page_safe(page, angle):
+    """Fungsi untuk rotasi halaman PDF."""
+    try:
+        page.rotate(angle)
+    except Exception:
+        try:
+            generic = _pypdf2().generic
+            NameObject, NumberObject = generic.NameObject, generic.NumberObject
+            page.__setitem__(NameObject("/Rotate"), NumberObject(angle))
+        except Exception:
+            pass
+
+
+def count_pages(data: bytes) -> int:
+    """Jumlah halaman sebuah PDF."""
+    return len(_pypdf2().PdfReader(io.BytesIO(data)).pages)
+
+
+def _page_count(path: str) -> int:
+    with open(path, "rb") as fh:
+        return len(_open_reader(fh, os.path.basename(path)).pages)
+
+
+def _source_name(source) -> str:
+    return os.path.basename(source) if isinstance(source, (str, os.PathLike)) else getattr(source, "name", "PDF")
+
+
+def _open_reader(fh, name: str):
+    """PdfReader atas file yang sudah terbuka; PDF terkunci dicoba dibuka dengan password kosong."""
+    reader = _pypdf2().PdfReader(fh)
+    if reader.is_encrypted:
+        try:
+            ok = reader.decrypt("")
+        except Exception:
+            ok = 0
+        if not ok:
+            raise EngineError(f"PDF terkunci password: {name}")
+    return reader
+
+
+def _stream_digest(generic, stream) -> bytes:
+    """Hash isi stream + dictionary-nya (kunci diurutkan, /Length diabaikan)."""
+    buf = io.BytesIO()
+    for k in sorted(stream.keys()):
+        generic.NameObject(k).write_to_stream(buf, None)
+        stream[k].write_to_stream(buf, None)
+    h = hashlib.sha256(buf.getvalue())
+    h.update(stream._data)
+    return h.digest()
+
+
+def _page_keys(reader) -> frozenset:
+    """(idnum, generation) semua halaman `reader`, dihitung sekali per reader."""
+    keys = getattr(reader, "_master_page_keys", None)
+    if keys is None:
+        keys = frozenset((p.indirect_reference.idnum, p.indirect_reference.generation)
+                         for p in reader.pages if p.indirect_reference is not None)
+        reader._master_page_keys = keys
+    return keys
+
+
+def _copy_document(out: IncrementalPdfWriter, reader, dedup: dict = None, recompress: bool = False, stats: dict = None,
+                   page_indices=None):
+    """Menyalin halaman `reader` (semua, atau indeks 0-based di `page_indices`) beserta objek
+    yang dirujuknya ke `out`. Rujukan ke halaman yang tidak ikut disalin menjadi null.
+
+    Objek dinomori ulang dan langsung ditulis satu per satu (BFS dari halaman), sehingga
+    yang tinggal di memori hanya objek dokumen sumber yang sedang dibaca.
+
+    Dengan `dedup` (dict hash -> nomor objek, dipakai bersama antar dokumen) setiap stream
+    (font, gambar, isi halaman) di-hash setelah rujukannya disalin; stream yang isinya sama
+    persis hanya ditulis sekali. `recompress=True` mengompres stream tanpa filter dengan Flate.
+    """
+    generic = _pypdf2().generic
+    stats = stats if stats is not None else {}
+    mapping = {}
+    queue = deque()
+    hashing = set()
+    parent = generic.IndirectObject(out.pages_num, 0, None)
+    all_pages = reader.pages
+    page_keys = _page_keys(reader)
+
+    def ref(ind):
+        key = (ind.idnum, ind.generation)
+        if key in mapping:
+            return generic.IndirectObject(mapping[key], 0, None)
+        if key in page_keys:
+            return generic.NullObject()
+        if key in hashing:
+            # Rujukan melingkar ke stream yang sedang di-hash: nomornya dicadangkan saja.
+            mapping[key] = out.reserve()
+            return generic.IndirectObject(mapping[key], 0, None)
+        obj = ind.get_object() if dedup is not None else None
+        if isinstance(obj, generic.StreamObject):
+            hashing.add(key)
+            dup = remap(obj)
+            hashing.discard(key)
+            if key in mapping:
+                out.write_object(mapping[key], dup)
+            else:
+                digest = _stream_digest(generic, dup)
+                num = dedup.get(digest)
+                if num is None:
+                    num = dedup[digest] = out.reserve()
+                    out.write_object(num, dup)
+                else:
+                    stats["dedup_objects"] = stats.get("dedup_objects", 0) + 1
+                    stats["dedup_bytes"] = stats.get("dedup_bytes", 0) + len(dup._data)
+                mapping[key] = num
+        else:
+            mapping[key] = out.reserve()
+            queue.append(ind)
+        return generic.IndirectObject(mapping[key], 0, None)
+
+    def remap(obj, skip=()):
+        if isinstance(obj, generic.IndirectObject):
+            return ref(obj)
+        if isinstance(obj, generic.StreamObject):
+            dup = generic.EncodedStreamObject() if "/Filter" in obj else generic.DecodedStreamObject()
+            dup._data = obj._data
+            skip = ("/Length",)
+            if recompress and "/Filter" not in obj and "/DecodeParms" not in obj:
+                packed = zlib.compress(obj._data, 9)
+                if len(packed) < len(obj._data):
+                    dup = generic.EncodedStreamObject()
+                    dup._data = packed
+                    dup[generic.NameObject("/Filter")] = generic.NameObject("/FlateDecode")
+                    stats["recompressed"] = stats.get("recompressed", 0) + 1
+        elif isinstance(obj, generic.DictionaryObject):
+            dup = generic.DictionaryObject()
+        elif isinstance(obj, generic.ArrayObject):
+            return generic.ArrayObject(remap(v) for v in obj)
+        else:
+            return obj
+        for k, v in obj.items():
+            if k not in skip:
+                dup[k] = remap(v)
+        return dup
+
+    pages, direct = {}, []
+    selected = all_pages if page_indices is None else [all_pages[i] for i in page_indices]
+    for page in selected:
+        ind = page.indirect_reference
+        if ind is None:
+            num = out.reserve()
+            direct.append((num, page))
+        else:
+            key = (ind.idnum, ind.generation)
+            if key not in mapping:
+                mapping[key] = out.reserve()
+                pages[mapping[key]] = page
+                queue.append(ind)
+            num = mapping[key]
+        out.add_page(num)
+    for num, page in direct:
+        dup = remap(page, skip=("/Parent",))
+        dup[generic.NameObject("/Parent")] = parent
+        out.write_object(num, dup)
+    while queue:
+        ind = queue.popleft()
+        num = mapping[(ind.idnum, ind.generation)]
+        if num in pages:
+            obj = remap(pages[num], skip=("/Parent",))
+            obj[generic.NameObject("/Parent")] = parent
+        else:
+            obj = ind.get_object()
+            obj = remap(obj if obj is not None else generic.NullObject())
+        out.write_object(num, obj)
+
+
+def _source_size(source) -> int:
+    if isinstance(source, (str, os.PathLike)):
+        return os.path.getsize(source)
+    pos = source.seek(0, os.SEEK_END)
+    source.seek(0)
+    return pos
+
+
+def merge_pdf_files(sources, target, optimise: bool = False) -> dict:
+    """Menggabungkan PDF sesuai urutan dan menulis hasilnya bertahap ke `target`.
+
+    `sources` berisi path atau file biner (mis. UploadedFile); `target` berupa path atau
+    file biner yang bisa `tell()` (mis. `spool.new_spool()`). Sumber dibuka satu per satu
+    dan objeknya langsung ditulis, jadi memori puncak sebesar satu PDF sumber terbesar,
+    bukan seluruh hasil. `optimise=True` menyimpan satu salinan untuk stream identik
+    (font, logo, kop surat) di seluruh dokumen dan mengompres ulang stream tanpa filter.
+
+    Mengembalikan statistik: files, pages, bytes_in, bytes_out, dedup_objects, dedup_bytes, recompressed.
+    """
+    owns = isinstance(target, (str, os.PathLike))
+    fh = open(target, "wb") if owns else target
+    stats = {"files": 0, "pages": 0, "bytes_in": 0, "bytes_out": 0, "dedup_objects": 0, "dedup_bytes": 0, "recompressed": 0}
+    dedup = {} if optimise else None
+    try:
+        start = fh.tell()
+        out = IncrementalPdfWriter(fh)
+        for source in sources:
+            name = _source_name(source)
+            try:
+                stats["bytes_in"] += _source_size(source)
+                if isinstance(source, (str, os.PathLike)):
+                    with open(source, "rb") as src:
+                        _copy_document(out, _open_reader(src, name), dedup, optimise, stats)
+                else:
+                    _copy_document(out, _open_reader(source, name), dedup, optimise, stats)
+            except EngineError:
+                raise
+            except Exception as e:
+                raise EngineError(f"Gagal membaca {name}: {e}") from e
+            stats["files"] += 1
+        if not out.page_count:
+            raise EngineError("Tidak ada halaman PDF untuk digabung.")
+        out.close()
+        stats["pages"] = out.page_count
+        stats["bytes_out"] = fh.tell() - start
+        return stats
+    finally:
+        if owns:
+            fh.close()
+
+
+def optimise_pdf(source, target) -> dict:
+    """Menulis ulang satu PDF dengan deduplikasi stream dan kompres ulang (lihat `merge_pdf_files`)."""
+    return merge_pdf_files([source], target, optimise=True)
+
+
+# Mode Pisah PDF: per halaman, setiap N halaman, rentang halaman ("1-3, 5, 8-"), per bookmark.
+SPLIT_MODES = ("pages", "every", "ranges", "bookmarks")
+
+
+def parse_page_ranges(text: str, num_pages: int) -> list:
+    """Mengubah teks "1-3, 5, 8-" menjadi daftar (awal, akhir) 1-based inklusif."""
+    ranges = []
+    for part in text.split(','):
+        part = part.strip()
+        if not part:
+            continue
+        start, sep, end = part.partition('-')
+        try:
+            start = int(start) if start.strip() else 1
+            end = (int(end) if end.strip() else num_pages) if sep else start
+        except ValueError:
+            raise EngineError(f"Rentang halaman tidak valid: '{part}'")
+        if not 1 <= start <= end <= num_pages:
+            raise EngineError(f"Rentang '{part}' harus di antara 1 sampai {num_pages}.")
+        ranges.append((start, end))
+    if not ranges:
+        raise EngineError("Rentang halaman kosong.")
+    return ranges
+
+
+def _bookmark_starts(reader) -> list:
+    """(judul, indeks halaman) untuk bookmark level teratas, urut halaman."""
+    starts = []
+    for item in reader.outline:
+        if isinstance(item, list):
+            continue
+        try:
+            starts.append((str(item.title), reader.get_destination_page_number(item)))
+        except Exception:
+            continue
+    return sorted(starts, key=lambda x: x[1])
+
+
+def split_plan(source, mode: str = "pages", every: int = 1, ranges: str = None) -> list:
+    """Rencana Pisah PDF: daftar (nama_file, [indeks halaman 0-based]) sesuai `mode` (lihat `SPLIT_MODES`).
+
+    `source` berupa path atau file biner; hanya struktur halaman/bookmark yang dibaca.
+    Pada mode "ranges" rentang yang sama persis hanya dipakai sekali (nama file tetap unik).
+    """
+    if isinstance(source, (str, os.PathLike)):
+        with open(source, "rb") as fh:
+            return split_plan(fh, mode, every, ranges)
+    reader = _open_reader(source, _source_name(source))
+    n = len(reader.pages)
+    width = len(str(n))
+    if mode == "pages":
+        return [(f"page_{i+1}.pdf", [i]) for i in range(n)]
+    if mode == "every":
+        if every < 1:
+            raise EngineError("Jumlah halaman per file minimal 1.")
+        return [(f"pages_{i+1:0{width}d}-{min(i+every, n):0{width}d}.pdf", list(range(i, min(i + every, n))))
+                for i in range(0, n, every)]
+    if mode == "ranges":
+        return [(f"pages_{a}-{b}.pdf" if a != b else f"page_{a}.pdf", list(range(a - 1, b)))
+                for a, b in dict.fromkeys(parse_page_ranges(ranges or "", n))]
+    if mode == "bookmarks":
+        starts = _bookmark_starts(reader)
+        if not starts:
+            raise EngineError("PDF tidak memiliki bookmark.")
+        if starts[0][1] > 0:
+            starts.insert(0, ("Awal", 0))
+        plan = []
+        for k, (title, first) in enumerate(starts):
+            last = starts[k + 1][1] if k + 1 < len(starts) else n
+            if last > first:
+                safe = re.sub(r'[\\/:*?"<>|]+', '_', title).strip() or "bookmark"
+                plan.append((f"{len(plan)+1:02d}_{safe[:80]}.pdf", list(range(first, last))))
+        return plan
+    raise EngineError(f"Mode split tidak dikenal: {mode}")
+
+
+# Reader PDF sumber per proses worker split, dibuka saat tugas pertama datang.
+_split_source = {"path": None, "fh": None, "reader": None}
+
+
+def _split_reader(path: str):
+    if _split_source["path"] != path:
+        _close_split_reader()
+        fh = open(path, "rb")
+        _split_source.update(path=path, fh=fh, reader=_open_reader(fh, os.path.basename(path)))
+    return _split_source["reader"]
+
+
+def _close_split_reader():
+    if _split_source["fh"] is not None:
+        _split_source["fh"].close()
+    _split_source.update(path=None, fh=None, reader=None)
+
+
+def _write_split_parts(job) -> list:
+    """Worker Pisah PDF: menulis sekumpulan bagian (nama, indeks halaman) dari PDF di `path`."""
+    path, parts = job
+    reader = _split_reader(path)
+    out = []
+    for name, indices in parts:
+        buf = io.BytesIO()
+        writer = IncrementalPdfWriter(buf)
+        _copy_document(writer, reader, page_indices=indices)
+        writer.close()
+        out.append((name, buf.getvalue()))
+    return out
+
+
+def write_split_zip(path: str, plan: list, zs, workers: int = None, pages_per_job: int = 50, progress=None) -> int:
+    """Menulis setiap bagian `plan` (dari `split_plan`) sebagai PDF ke `ZipStream` `zs`.
+
+    Bagian dikelompokkan per ~`pages_per_job` halaman dan ditulis paralel di process pool;
+    tiap worker membuka PDF sumber di `path` sekali (lazy) lalu hanya membaca halaman yang
+    dibutuhkan. Hasil langsung masuk arsip sesuai urutan. Mengembalikan jumlah file.
+    """
+    jobs, batch, size = [], [], 0
+    for name, indices in plan:
+        batch.append((name, indices))
+        size += len(indices)
+        if size >= pages_per_job:
+            jobs.append((path, batch))
+            batch, size = [], 0
+    if batch:
+        jobs.append((path, batch))
+    if workers is None and len(jobs) <= 1:
+        workers = 1
+    throttle = ProgressThrottle(progress, len(plan))
+    done = 0
+    try:
+        for parts in bounded_map(_write_split_parts, jobs, workers=workers, ordered=True):
+            for name, data in parts:
+                zs.add(name, data)
+            done += len(parts)
+            throttle.update(done)
+    finally:
+        _close_split_reader()
+    return done
+
+
+def parse_page_order(text: str, num_pages: int) -> list:
+    """Mengubah teks "3, 1, 2" menjadi indeks halaman 0-based dan memvalidasi rentangnya."""
+    input_list = [int(x.strip()) for x in text.split(',') if x.strip().isdigit()]
+    if any(n < 1 or n > num_pages for n in input_list):
+        raise EngineError(f"Nomor halaman harus antara 1 sampai {num_pages}.")
+    return [n - 1 for n in input_list]
+
+
+def reorder_pages(data: bytes, order: list) -> bytes:
+    """Menyusun ulang/menghapus halaman; `order` berisi indeks 0-based."""
+    PyPDF2 = _pypdf2()
+    reader = PyPDF2.PdfReader(io.BytesIO(data))
+    writer = PyPDF2.PdfWriter()
+    for index in order:
+        writer.add_page(reader.pages[index])
+    return _writer_bytes(writer)
+
+
+def encrypt_pdf(data: bytes, password: str) -> bytes:
+    """Mengunci PDF dengan password."""
+    PyPDF2 = _pypdf2()
+    reader = PyPDF2.PdfReader(io.BytesIO(data))
+    writer = PyPDF2.PdfWriter()
+    for p in reader.pages:
+        writer.add_page(p)
+    try_encrypt(writer, password)
+    return _writer_bytes(writer)
+
+
+# Ukuran halaman Image -> PDF dalam point (1/72 inci), posisi potret; "auto" = ukuran gambar.
+PAGE_SIZES = {"auto": None, "A4": (595.28, 841.89), "Letter": (612.0, 792.0), "Legal": (612.0, 1008.0), "F4": (609.45, 935.43)}
+# Penempatan gambar di halaman berukuran tetap: utuh di tengah, memenuhi (dipotong), atau ditarik.
+FIT_MODES = ("fit", "fill", "stretch")
+MM = 72 / 25.4
+_JPEG_COLORSPACES = {"L": b"/DeviceGray", "RGB": b"/DeviceRGB", "CMYK": b"/DeviceCMYK"}
+# Posisi ternormalisasi (x kanan, y bawah) piksel tersimpan -> posisi tampil, per tag EXIF Orientation.
+_ORIENTATIONS = {
+    1: lambda x, y: (x, y), 2: lambda x, y: (1 - x, y), 3: lambda x, y: (1 - x, 1 - y), 4: lambda x, y: (x, 1 - y),
+    5: lambda x, y: (y, x), 6: lambda x, y: (1 - y, x), 7: lambda x, y: (1 - y, 1 - x), 8: lambda x, y: (y, 1 - x),
+}
+
+
+def _num(value: float) -> bytes:
+    return (b"%.4f" % value).rstrip(b"0").rstrip(b".")
+
+
+def _image_matrix(orientation: int, x: float, y: float, w: float, h: float) -> bytes:
+    """Operand `cm` yang memetakan ruang gambar PDF (persegi satuan) ke kotak tampil (x, y, w, h)."""
+    orient = _ORIENTATIONS.get(orientation, _ORIENTATIONS[1])
+
+    def to_page(u, v):
+        dx, dy = orient(u, 1 - v)
+        return x + dx * w, y + (1 - dy) * h
+
+    e, f = to_page(0, 0)
+    a, b = (p - q for p, q in zip(to_page(1, 0), (e, f)))
+    c, d = (p - q for p, q in zip(to_page(0, 1), (e, f)))
+    return b" ".join(_num(v) for v in (a, b, c, d, e, f))
+
+
+def _image_xobject(data: bytes):
+    """(dictionary, stream, lebar, tinggi, orientasi, dpi, passthrough) untuk satu gambar.
+
+    JPEG Gray/RGB/CMYK disematkan apa adanya sebagai /DCTDecode (hanya header yang dibaca;
+    orientasi EXIF diterapkan lewat matriks halaman). Format lain di-decode, diratakan ke
+    latar putih bila transparan, lalu dikompres /FlateDecode.
+    """
+    im = Image.open(io.BytesIO(data))
+    dpi = im.info.get("dpi") or (72, 72)
+    if im.format == "JPEG" and im.mode in _JPEG_COLORSPACES:
+        orientation = im.getexif().get(274, 1)
+        extra = b" /Decode [1 0 1 0 1 0 1 0]" if im.mode == "CMYK" else b""
+        dictionary = (b"/Type /XObject /Subtype /Image /Width %d /Height %d /ColorSpace %s /BitsPerComponent 8 /Filter /DCTDecode%s"
+                      % (im.width, im.height, _JPEG_COLORSPACES[im.mode], extra))
+        return dictionary, data, im.width, im.height, orientation, dpi, True
+    im = ImageOps.exif_transpose(im)
+    if im.mode in ("RGBA", "LA", "PA") or (im.mode == "P" and "transparency" in im.info):
+        rgba = im.convert("RGBA")
+        im = Image.new("RGB", rgba.size, (255, 255, 255))
+        im.paste(rgba, mask=rgba.getchannel("A"))
+    elif im.mode not in ("L", "RGB"):
+        im = im.convert("L" if im.mode in ("1", "I", "I;16", "F") else "RGB")
+    colorspace = b"/DeviceGray" if im.mode == "L" else b"/DeviceRGB"
+    dictionary = (b"/Type /XObject /Subtype /Image /Width %d /Height %d /ColorSpace %s /BitsPerComponent 8 /Filter /FlateDecode"
+                  % (im.width, im.height, colorspace))
+    return dictionary, zlib.compress(im.tobytes(), 6), im.width, im.height, 1, dpi, False
+
+
+def _page_layout(img_w: float, img_h: float, page_size: str, fit: str, margin: float):
+    """(lebar_halaman, tinggi_halaman, x, y, w, h) dalam point; halaman tetap ikut orientasi gambar."""
+    size = PAGE_SIZES[page_size]
+    if size is None:
+        return img_w + 2 * margin, img_h + 2 * margin, margin, margin, img_w, img_h
+    page_w, page_h = sorted(size, reverse=img_w > img_h)
+    box_w, box_h = page_w - 2 * margin, page_h - 2 * margin
+    if box_w <= 0 or box_h <= 0:
+        raise EngineError("Margin terlalu besar untuk ukuran halaman.")
+    if fit == "stretch":
+        w, h = box_w, box_h
+    else:
+        scale = (min if fit == "fit" else max)(box_w / img_w, box_h / img_h)
+        w, h = img_w * scale, img_h * scale
+    return page_w, page_h, margin + (box_w - w) / 2, margin + (box_h - h) / 2, w, h
+
+
+def images_to_pdf(images, target, page_size: str = "auto", fit: str = "fit", margin_mm: float = 0, progress=None) -> dict:
+    """Menyusun gambar menjadi PDF satu halaman per gambar, ditulis bertahap ke `target`.
+
+    `images` berisi bytes, path, atau file biner (mis. UploadedFile); hanya satu gambar yang
+    dibaca dalam satu waktu. JPEG disematkan tanpa decode/encode ulang (lihat `_image_xobject`).
+    `page_size` salah satu `PAGE_SIZES` ("auto" = ukuran gambar menurut DPI-nya, default 72),
+    `fit` salah satu `FIT_MODES` untuk halaman berukuran tetap, `margin_mm` jarak tepi.
+    Mengembalikan statistik: pages, passthrough, reencoded, bytes_out.
+    """
+    if page_size not in PAGE_SIZES:
+        raise EngineError(f"Ukuran halaman tidak dikenal: {page_size}")
+    if fit not in FIT_MODES:
+        raise EngineError(f"Mode penempatan tidak dikenal: {fit}")
+    owns = isinstance(target, (str, os.PathLike))
+    fh = open(target, "wb") if owns else target
+    stats = {"pages": 0, "passthrough": 0, "reencoded": 0, "bytes_out": 0}
+    margin = margin_mm * MM
+    total = len(images) if hasattr(images, "__len__") else 0
+    throttle = ProgressThrottle(progress if total else None, total)
+    try:
+        start = fh.tell()
+        out = IncrementalPdfWriter(fh)
+        for source in images:
+            name = _source_name(source) if not isinstance(source, (bytes, bytearray)) else f"gambar {stats['pages'] + 1}"
+            try:
+                if isinstance(source, (str, os.PathLike)):
+                    with open(source, "rb") as src:
+                        data = src.read()
+                elif isinstance(source, (bytes, bytearray)):
+                    data = bytes(source)
+                else:
+                    source.seek(0)
+                    data = source.read()
+                dictionary, stream, px_w, px_h, orientation, dpi, passthrough = _image_xobject(data)
+            except Exception as e:
+                raise EngineError(f"Gagal membaca gambar {name}: {e}") from e
+            del data
+            if orientation >= 5:
+                px_w, px_h, dpi = px_h, px_w, dpi[::-1]
+            img_w, img_h = (px * 72 / (d if d and d > 1 else 72) for px, d in zip((px_w, px_h), dpi))
+            page_w, page_h, x, y, w, h = _page_layout(img_w, img_h, page_size, fit, margin)
+            image_num, content_num, page_num = out.reserve(), out.reserve(), out.reserve()
+            out.write_stream(image_num, dictionary, stream)
+            del stream
+            box = b" ".join(_num(v) for v in (margin, margin, page_w - 2 * margin, page_h - 2 * margin))
+            content = b"q %s re W n %s cm /Im0 Do Q" % (box, _image_matrix(orientation, x, y, w, h))
+            out.write_stream(content_num, b"", content)
+            out.write_raw(page_num, b"<< /Type /Page /Parent %d 0 R /MediaBox [0 0 %s %s] /Resources << /XObject << /Im0 %d 0 R >> "
+                                    b"/ProcSet [/PDF /ImageB /ImageC] >> /Contents %d 0 R >>"
+                          % (out.pages_num, _num(page_w), _num(page_h), image_num, content_num))
+            out.add_page(page_num)
+            stats["pages"] += 1
+            stats["passthrough" if passthrough else "reencoded"] += 1
+            throttle.update(stats["pages"])
+        if not out.page_count:
+            raise EngineError("Tidak ada gambar untuk dikonversi.")
+        out.close()
+        stats["bytes_out"] = fh.tell() - start
+        return stats
+    finally:
+        if owns:
+            fh.close()
+
+
+# Format keluaran PDF -> Image: (ekstensi, fmt pdftoppm atau None jika di-encode PIL).
+IMAGE_FORMATS = {"png": (".png", "png"), "jpeg": (".jpg", "jpeg"), "webp": (".webp", None)}
+
+
+def render_pdf_pages(path: str, dpi: int = 150, fmt: str = "png", quality: int = 85, window: int = 8,
+                     thread_count: int = None):
+    """Render halaman PDF di `path` per jendela `window` halaman (`first_page`/`last_page`).
+
+    Poppler (`thread_count` proses) menulis langsung ke folder temporary: PNG/JPEG apa adanya,
+    WEBP dari PPM yang di-encode PIL satu halaman per satu, jadi tidak ada halaman yang ditahan
+    di memori. Menghasilkan (page_N.ext, path_file) satu per satu; file dihapus setelah konsumen
+    lanjut ke item berikutnya, jadi pakai isinya (mis. `ZipStream.add_file`) sebelum itu.
+    """
+    if fmt not in IMAGE_FORMATS:
+        raise EngineError(f"Format gambar tidak didukung: {fmt}")
+    pdf2image = capabilities.load("pdf2image")
+    ext, poppler_fmt = IMAGE_FORMATS[fmt]
+    n = _page_count(path)
+    threads = thread_count or min(window, default_workers())
+    with tempfile.TemporaryDirectory() as tmp:
+        for first in range(1, n + 1, window):
+            last = min(first + window - 1, n)
+            paths = pdf2image.convert_from_path(
+                path, dpi=dpi, first_page=first, last_page=last, fmt=poppler_fmt or "ppm", thread_count=threads,
+                output_folder=tmp, paths_only=True, jpegopt={"quality": quality} if fmt == "jpeg" else None)
+            for page, img_path in enumerate(paths, first):
+                if not poppler_fmt:
+                    out_path = os.path.splitext(img_path)[0] + ext
+                    with Image.open(img_path) as img:
+                        img.save(out_path, format=fmt.upper(), quality=quality)
+                    os.remove(img_path)
+                    img_path = out_path
+                yield f"page_{page}{ext}", img_path
+                os.remove(img_path)
+
+
+def write_pdf_images_zip(path: str, zs, dpi: int = 150, fmt: str = "png", quality: int = 85, window: int = 8,
+                         thread_count: int = None, progress=None) -> int:
+    """Render PDF ke gambar (lihat `render_pdf_pages`) dan langsung menulisnya ke `ZipStream` `zs`."""
+    throttle = ProgressThrottle(progress, _page_count(path))
+    count = 0
+    for name, img_path in render_pdf_pages(path, dpi, fmt, quality, window, thread_count):
+        zs.add_file(name, img_path)
+        count += 1
+        throttle.update(count)
+    return count
@@ -0,0 +1,73 @@
+# master_engine/pdfwriter.py
+"""Penulis PDF inkremental: setiap objek langsung ditulis ke file keluaran begitu siap,
+lalu hanya offset-nya yang disimpan untuk tabel xref di akhir.
+
+Dipakai untuk merge PDF dan Image -> PDF agar memori tidak tumbuh mengikuti ukuran hasil.
+"""
+
+
+class IncrementalPdfWriter:
+    """Menulis PDF 1.7 satu objek per satu ke `fh` (file biner yang bisa `tell()`).
+
+    Objek nomor 1 dicadangkan untuk root /Pages; halaman didaftarkan lewat `add_page`
+    dan harus memakai `/Parent 1 0 R`. `close()` menulis /Pages, /Catalog, xref, dan trailer.
+    """
+
+    def __init__(self, fh):
+        self.fh = fh
+        self._offsets = [None]
+        self._kids = []
+        fh.write(b"%PDF-1.7\n%\xe2\xe3\xcf\xd3\n")
+        self.pages_num = self.reserve()
+
+    @property
+    def page_count(self) -> int:
+        return len(self._kids)
+
+    def reserve(self) -> int:
+        """Mencadangkan nomor objek baru (ditulis nanti dengan `write_*`)."""
+        self._offsets.append(None)
+        return len(self._offsets) - 1
+
+    def _begin(self, num: int):
+        self._offsets[num] = self.fh.tell()
+        self.fh.write(b"%d 0 obj\n" % num)
+
+    def write_raw(self, num: int, body: bytes):
+        """Menulis objek yang isinya sudah diserialisasi (tanpa `N 0 obj`/`endobj`)."""
+        self._begin(num)
+        self.fh.write(body)
+        self.fh.write(b"\nendobj\n")
+
+    def write_stream(self, num: int, dictionary: bytes, data: bytes):
+        """Menulis stream object; `dictionary` adalah isi `<< ... >>` tanpa /Length."""
+        self._begin(num)
+        self.fh.write(b"<< %s /Length %d >>\nstream\n" % (dictionary, len(data)))
+        self.fh.write(data)
+        self.fh.write(b"\nendstream\nendobj\n")
+
+    def write_object(self, num: int, obj):
+        """Menulis objek PyPDF2 (`PdfObject`) apa adanya."""
+        self._begin(num)
+        obj.write_to_stream(self.fh, None)
+        self.fh.write(b"\nendobj\n")
+
+    def add_page(self, num: int):
+        """Mendaftarkan objek halaman bernomor `num` ke /Pages (urutan pemanggilan = urutan halaman)."""
+        self._kids.append(num)
+
+    def close(self):
+        """Menulis /Pages, /Catalog, tabel xref, dan trailer. Semua nomor yang dicadangkan harus sudah ditulis."""
+        kids = b" ".join(b"%d 0 R" % n for n in self._kids)
+        self.write_raw(self.pages_num, b"<< /Type /Pages /Kids [%s] /Count %d >>" % (kids, len(self._kids)))
+        catalog_num = self.reserve()
+        self.write_raw(catalog_num, b"<< /Type /Catalog /Pages %d 0 R >>" % self.pages_num)
+        missing = [n for n, off in enumerate(self._offsets) if n and off is None]
+        if missing:
+            raise ValueError(f"Objek PDF belum ditulis: {missing[:10]}")
+        xref_offset = self.fh.tell()
+        self.fh.write(b"xref\n0 %d\n0000000000 65535 f \n" % len(self._offsets))
+        for off in self._offsets[1:]:
+            self.fh.write(b"%010d 00000 n \n" % off)
+        self.fh.write(b"trailer\n<< /Size %d /Root %d 0 R >>\nstartxref\n%d\n%%%%EOF\n"
+                      % (len(self._offsets), catalog_num, xref_offset))
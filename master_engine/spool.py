@@ -0,0 +1,46 @@
+# master_engine/spool.py
+"""File keluaran sementara untuk hasil tools: di memori selama kecil, pindah ke disk jika besar."""
+import contextlib
+import io
+import os
+import shutil
+import tempfile
+
+# Di atas ukuran ini hasil (ZIP, PDF gabungan, ...) pindah dari memori ke file temporary.
+SPOOL_THRESHOLD = 32 * 1024 * 1024
+
+
+def new_spool(threshold: int = SPOOL_THRESHOLD):
+    """`SpooledTemporaryFile` biner untuk menulis hasil secara bertahap."""
+    return tempfile.SpooledTemporaryFile(max_size=threshold)
+
+
+def as_download(spool):
+    """Isi spool sebagai objek file di posisi 0 untuk `st.download_button`.
+
+    BytesIO jika masih di memori, atau BufferedReader ke file temporary jika sudah
+    tumpah ke disk (tanpa menyalin seluruh isi ke memori di sini).
+    """
+    spool.seek(0)
+    inner = spool._file
+    if isinstance(inner, io.BytesIO):
+        return inner
+    reader = open(os.dup(inner.fileno()), "rb")
+    reader.seek(0)
+    return reader
+
+
+@contextlib.contextmanager
+def on_disk(fileobj, suffix: str = ""):
+    """Menyalin file (mis. UploadedFile) per blok ke file temporary dan menghasilkan path-nya.
+
+    Dipakai bila worker proses lain perlu membuka sumber sendiri; file dihapus setelah selesai.
+    """
+    fd, path = tempfile.mkstemp(suffix=suffix)
+    try:
+        with os.fdopen(fd, "wb") as dst:
+            fileobj.seek(0)
+            shutil.copyfileobj(fileobj, dst, 1024 * 1024)
+        yield path
+    finally:
+        os.remove(path)
@@ -0,0 +1,136 @@
+# master_engine/tabular.py
+"""Membaca tabel unggahan (CSV/TXT/JSON/Excel) dengan cache per isi file, dan menulis Excel.
+
+Streamlit menjalankan ulang script setiap kali widget berubah; `read_table` menyimpan hasil
+parse berdasarkan hash isi file + opsi baca, jadi rerun tidak mem-parse workbook lagi.
+"""
+import hashlib
+import io
+import threading
+from collections import OrderedDict
+
+import pandas as pd
+
+from . import capabilities
+from .errors import EngineError
+
+# Batas total memori DataFrame yang disimpan di cache `read_table` (dibuang LRU jika penuh).
+TABLE_CACHE_BYTES = 512 * 1024 * 1024
+# categories="auto": kolom teks dengan nilai unik <= rasio ini dari jumlah baris jadi category.
+CATEGORY_MAX_RATIO = 0.5
+
+
+class TableCache:
+    """Cache LRU thread-safe: (hash_isi, format, opsi) -> DataFrame, dibatasi total bytes."""
+
+    def __init__(self, max_bytes: int = TABLE_CACHE_BYTES):
+        self.max_bytes = max_bytes
+        self._data = OrderedDict()
+        self._size = 0
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key):
+        with self._lock:
+            if key in self._data:
+                self._data.move_to_end(key)
+                self.hits += 1
+                return self._data[key][0]
+            self.misses += 1
+            return None
+
+    def put(self, key, df):
+        size = int(df.memory_usage(index=True, deep=True).sum())
+        if size > self.max_bytes:
+            return
+        with self._lock:
+            if key in self._data:
+                self._size -= self._data.pop(key)[1]
+            self._data[key] = (df, size)
+            self._size += size
+            while self._size > self.max_bytes:
+                self._size -= self._data.popitem(last=False)[1][1]
+
+    def clear(self):
+        with self._lock:
+            self._data.clear()
+            self._size = 0
+            self.hits = self.misses = 0
+
+    def info(self) -> dict:
+        return {"hits": self.hits, "misses": self.misses, "entries": len(self._data), "bytes": self._size, "max_bytes": self.max_bytes}
+
+
+table_cache = TableCache()
+
+
+def _read_excel(buf, **kwargs):
+    """`pd.read_excel` dengan engine calamine jika terpasang, selain itu engine bawaan pandas."""
+    if capabilities.available("calamine"):
+        try:
+            return pd.read_excel(buf, engine="calamine", **kwargs)
+        except Exception:
+            buf.seek(0)
+    return pd.read_excel(buf, **kwargs)
+
+
+def _parse(raw: bytes, name: str, usecols):
+    # Kolom yang tidak ada dibiarkan (bukan error) agar validasi kolom tetap di tool pemanggil.
+    pick = (lambda c: c in usecols) if usecols else None
+    if name.endswith((".csv", ".txt")):
+        return pd.read_csv(io.BytesIO(raw), usecols=pick)
+    if name.endswith(".json"):
+        df = pd.read_json(io.BytesIO(raw))
+        return df[[c for c in df.columns if c in usecols]] if usecols else df
+    if name.endswith((".xlsx", ".xls")):
+        return _read_excel(io.BytesIO(raw), usecols=pick)
+    raise EngineError(f"Format file tidak didukung: {name}")
+
+
+def compact_dtypes(df, categories="auto"):
+    """Mengubah kolom teks menjadi `category` (hemat memori, groupby/value_counts lebih cepat).
+
+    `categories` berupa daftar nama kolom, atau "auto" untuk semua kolom teks dengan nilai
+    unik paling banyak `CATEGORY_MAX_RATIO` dari jumlah baris.
+    """
+    if categories == "auto":
+        limit = max(1, int(len(df) * CATEGORY_MAX_RATIO))
+        cols = [c for c in df.columns
+                if (pd.api.types.is_object_dtype(df[c]) or pd.api.types.is_string_dtype(df[c]))
+                and not isinstance(df[c].dtype, pd.CategoricalDtype) and df[c].nunique(dropna=True) <= limit]
+    else:
+        cols = [c for c in categories if c in df.columns]
+    if cols:
+        df = df.astype({c: "category" for c in cols})
+    return df
+
+
+def read_table(raw: bytes, filename: str, usecols=None, categories=None):
+    """Membaca CSV/TXT/JSON/Excel dari bytes menjadi DataFrame berdasarkan ekstensi file.
+
+    `usecols` (daftar nama kolom) membatasi kolom yang dibaca; kolom yang tidak ada di file
+    diabaikan. `categories` diteruskan ke `compact_dtypes` ("auto" atau daftar kolom).
+    Hasil disimpan di `table_cache` per hash isi + opsi; yang dikembalikan adalah salinan
+    dangkal, jadi pemanggil bebas mengganti nama/menambah kolom.
+    """
+    name = filename.lower()
+    usecols = tuple(usecols) if usecols else None
+    cats = categories if categories in (None, "auto") else tuple(categories)
+    key = (hashlib.sha256(raw).hexdigest(), name.rsplit(".", 1)[-1], usecols, cats)
+    df = table_cache.get(key)
+    if df is None:
+        df = _parse(raw, name, usecols)
+        if cats:
+            df = compact_dtypes(df, cats)
+        table_cache.put(key, df)
+    return df.copy(deep=False)
+
+
+def df_to_excel_bytes(df: pd.DataFrame) -> bytes:
+    """Mengonversi DataFrame ke bytes file Excel."""
+    out = io.BytesIO()
+    with pd.ExcelWriter(out, engine="openpyxl") as writer:
+        df.to_excel(writer, index=False)
+    out.seek(0)
+    return out.getvalue()
@@ -0,0 +1,309 @@
+# master_engine/translate.py
+"""Terjemahan teks PDF: segmen per baris, memori terjemahan SQLite, dispatcher paralel dengan
+rate limit, dan hasil Word.
+
+Backend bisa diganti (`BACKENDS`): "google" memakai deep-translator, "stub" menerjemahkan
+secara lokal tanpa jaringan untuk uji coba.
+"""
+import hashlib
+import io
+import os
+import random
+import sqlite3
+import threading
+import time
+
+from . import capabilities
+from .errors import EngineError
+from .parallel import ProgressThrottle, bounded_map
+
+PAGE_BREAK = "---HALAMAN BARU---"
+CHUNK_SIZE = 4500
+
+
+def page_lines(page_texts) -> list:
+    """Baris-baris semua halaman dengan `PAGE_BREAK` di akhir tiap halaman.
+
+    Setiap baris tidak kosong adalah satu segmen terjemahan (satu paragraf di Word); baris
+    kosong dan `PAGE_BREAK` diteruskan apa adanya.
+    """
+    lines = []
+    for page_text in page_texts:
+        lines.extend(page_text.split('\n'))
+        lines.append(PAGE_BREAK)
+    return lines
+
+
+def has_text(lines) -> bool:
+    return any(c.strip() for c in lines if c != PAGE_BREAK)
+
+
+def normalise_segment(text: str) -> str:
+    """Bentuk kunci segmen: spasi berurutan/di tepi diringkas (huruf besar/kecil tetap)."""
+    return " ".join(text.split())
+
+
+def segment_hash(text: str) -> str:
+    return hashlib.sha256(normalise_segment(text).encode("utf-8")).hexdigest()
+
+
+def pack_segments(segments, chunk_size: int = CHUNK_SIZE) -> list:
+    """Mengelompokkan segmen menjadi batch yang digabung '\n\n' paling panjang `chunk_size` karakter."""
+    batches, current, size = [], [], 0
+    for seg in segments:
+        if current and size + len(seg) + 2 > chunk_size:
+            batches.append(current)
+            current, size = [], 0
+        current.append(seg)
+        size += len(seg) + 2
+    if current:
+        batches.append(current)
+    return batches
+
+
+class TranslationMemory:
+    """Memori terjemahan persisten (SQLite): (backend, bahasa sumber, bahasa tujuan, hash segmen) -> terjemahan."""
+
+    def __init__(self, path: str = None):
+        self.path = path or os.environ.get("MASTER_TM_PATH") or os.path.join(os.path.expanduser("~"), ".master_app", "translation_memory.sqlite3")
+        if self.path != ":memory:":
+            os.makedirs(os.path.dirname(os.path.abspath(self.path)), exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(self.path, check_same_thread=False, timeout=30)
+        with self._lock, self._conn:
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS tm (backend TEXT, src TEXT, tgt TEXT, hash TEXT, source TEXT, target TEXT, "
+                "created REAL, PRIMARY KEY (backend, src, tgt, hash)) WITHOUT ROWID")
+
+    def get_many(self, backend: str, src: str, tgt: str, hashes) -> dict:
+        """Terjemahan yang sudah tersimpan untuk `hashes` (dict hash -> teks)."""
+        hashes = list(hashes)
+        found = {}
+        with self._lock:
+            for i in range(0, len(hashes), 500):
+                batch = hashes[i:i + 500]
+                rows = self._conn.execute(
+                    f"SELECT hash, target FROM tm WHERE backend=? AND src=? AND tgt=? AND hash IN ({','.join('?' * len(batch))})",
+                    [backend, src, tgt, *batch])
+                found.update(rows)
+        return found
+
+    def put_many(self, backend: str, src: str, tgt: str, items):
+        """Menyimpan [(hash, teks_sumber, terjemahan)]."""
+        now = time.time()
+        with self._lock, self._conn:
+            self._conn.executemany("INSERT OR REPLACE INTO tm VALUES (?, ?, ?, ?, ?, ?, ?)",
+                                   [(backend, src, tgt, h, source, target, now) for h, source, target in items])
+
+    def count(self) -> int:
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM tm").fetchone()[0]
+
+    def clear(self):
+        with self._lock, self._conn:
+            self._conn.execute("DELETE FROM tm")
+
+    def close(self):
+        self._conn.close()
+
+
+class TokenBucket:
+    """Rate limiter token bucket thread-safe: rata-rata `rate` permintaan/detik, lonjakan sampai `burst`."""
+
+    def __init__(self, rate: float, burst: int = None):
+        self.rate = rate
+        self.capacity = burst or max(1, int(rate))
+        self._tokens = float(self.capacity)
+        self._last = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self):
+        """Menunggu sampai ada token lalu memakainya."""
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(self.capacity, self._tokens + (now - self._last) * self.rate)
+                self._last = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                wait = (1 - self._tokens) / self.rate
+            time.sleep(wait)
+
+
+class _PerThread:
+    """Satu klien per thread, dibuat oleh `factory` saat thread itu pertama memakainya.
+
+    Klien deep-translator menyimpan teks permintaan di atribut instance sebelum mengirimnya,
+    jadi satu instance tidak boleh dipakai bersama oleh thread dispatcher.
+    """
+
+    def __init__(self, factory):
+        self._factory = factory
+        self._local = threading.local()
+
+    def get(self):
+        client = getattr(self._local, "client", None)
+        if client is None:
+            client = self._local.client = self._factory()
+        return client
+
+
+class GoogleBackend:
+    """Backend deep-translator GoogleTranslator (satu translator per thread)."""
+
+    name = "google"
+
+    def __init__(self, source: str, target: str):
+        translator = capabilities.load("translator").GoogleTranslator
+        self._clients = _PerThread(lambda: translator(source=source, target=target))
+        self._clients.get()  # kode bahasa divalidasi sekarang, bukan di tengah dispatcher
+
+    def translate(self, text: str) -> str:
+        return self._clients.get().translate(text)
+
+
+class _StubClient:
+    """Meniru klien deep-translator: teks ditaruh di parameter instance lalu dibaca saat "dikirim"."""
+
+    def __init__(self, target: str, delay: float):
+        self._params = {"tl": target}
+        self.delay = delay
+
+    def translate(self, text: str) -> str:
+        self._params["q"] = text
+        if self.delay:
+            time.sleep(self.delay)
+        return f"[{self._params['tl']}] {self._params['q']}"
+
+
+class StubBackend:
+    """Backend lokal tanpa jaringan: menandai teks dengan kode bahasa tujuan.
+
+    `delay` mensimulasikan waktu round-trip, `fail_every` membuat setiap panggilan ke-N gagal
+    sekali (untuk menguji retry). `stateful=True` menerjemahkan lewat klien ber-state per
+    thread seperti `GoogleBackend`, untuk memeriksa bahwa dispatcher paralel tidak mencampur chunk.
+    """
+
+    name = "stub"
+
+    def __init__(self, source: str, target: str, delay: float = 0.0, fail_every: int = 0, stateful: bool = False):
+        self.target = target
+        self.delay = delay
+        self.fail_every = fail_every
+        self.calls = 0
+        self._lock = threading.Lock()
+        self._clients = _PerThread(lambda: _StubClient(target, delay)) if stateful else None
+
+    def translate(self, text: str) -> str:
+        with self._lock:
+            self.calls += 1
+            fail = self.fail_every and self.calls % self.fail_every == 0
+        if self._clients is not None:
+            if fail:
+                raise ConnectionError("stub: kegagalan sementara")
+            return self._clients.get().translate(text)
+        if self.delay:
+            time.sleep(self.delay)
+        if fail:
+            raise ConnectionError("stub: kegagalan sementara")
+        return f"[{self.target}] {text}"
+
+
+BACKENDS = {"google": GoogleBackend, "stub": StubBackend}
+
+
+def make_backend(name: str, source: str, target: str, **options):
+    if name not in BACKENDS:
+        raise EngineError(f"Backend terjemahan tidak dikenal: {name}")
+    return BACKENDS[name](source, target, **options)
+
+
+def translate_chunks(chunks, backend, workers: int = 4, rate: float = 5.0, burst: int = None, retries: int = 3,
+                     backoff: float = 0.5, progress=None) -> list:
+    """Menerjemahkan `chunks` dengan `workers` permintaan paralel; hasil sesuai urutan chunk.
+
+    Setiap permintaan mengambil token dari `TokenBucket(rate, burst)`. Kegagalan dicoba ulang
+    sampai `retries` kali dengan backoff eksponensial (`backoff * 2**n` + jitter). `PAGE_BREAK`
+    dan chunk kosong diteruskan tanpa permintaan.
+    """
+    bucket = TokenBucket(rate, burst)
+
+    def translate_one(item):
+        index, chunk = item
+        if chunk == PAGE_BREAK or not chunk.strip():
+            return chunk
+        for attempt in range(retries + 1):
+            bucket.acquire()
+            try:
+                return (backend.translate(chunk) or "").strip()
+            except Exception as e:
+                if attempt == retries:
+                    raise EngineError(f"Gagal menerjemahkan chunk {index + 1} setelah {retries + 1} percobaan: {e}") from e
+                time.sleep(backoff * 2 ** attempt * (1 + random.random() * 0.25))
+
+    chunks = list(chunks)
+    throttle = ProgressThrottle(progress, len(chunks))
+    out = []
+    for translated in bounded_map(translate_one, enumerate(chunks), workers=workers, ordered=True, threads=True):
+        out.append(translated)
+        throttle.update(len(out))
+    return out
+
+
+def translate_pages(page_texts, backend, source: str, target: str, memory: TranslationMemory = None,
+                    chunk_size: int = CHUNK_SIZE, progress=None, **dispatch):
+    """Menerjemahkan teks per halaman; mengembalikan (baris_terjemahan, statistik).
+
+    Segmen identik (setelah `normalise_segment`) hanya diterjemahkan sekali per dokumen, dan
+    yang sudah ada di `memory` tidak dikirim sama sekali. Sisanya dikemas per `chunk_size`
+    lalu dikirim lewat `translate_chunks` (`dispatch`: workers, rate, retries, ...); batch yang
+    jumlah barisnya berubah setelah diterjemahkan diulang per segmen. Statistik: segments,
+    unique, hits, misses, requests.
+    """
+    lines = page_lines(page_texts)
+    hashes = [segment_hash(l) if l != PAGE_BREAK and l.strip() else None for l in lines]
+    unique = {}
+    for line, h in zip(lines, hashes):
+        if h is not None:
+            unique.setdefault(h, normalise_segment(line))
+    name = getattr(backend, "name", type(backend).__name__)
+    known = memory.get_many(name, source, target, unique) if memory else {}
+    todo = [(h, seg) for h, seg in unique.items() if h not in known]
+    stats = {"segments": len(hashes) - hashes.count(None), "unique": len(unique),
+             "hits": len(known), "misses": len(todo), "requests": 0}
+
+    batches = pack_segments([seg for _, seg in todo], chunk_size)
+    results = translate_chunks(["\n\n".join(b) for b in batches], backend, progress=progress, **dispatch)
+    stats["requests"] += len(batches)
+    translated = []
+    for batch, result in zip(batches, results):
+        parts = [p.strip() for p in result.split("\n\n")]
+        translated.extend(parts if len(parts) == len(batch) else [None] * len(batch))
+    missing = [i for i, t in enumerate(translated) if t is None]
+    if missing:
+        redo = translate_chunks([todo[i][1] for i in missing], backend, **dispatch)
+        stats["requests"] += len(missing)
+        for i, text in zip(missing, redo):
+            translated[i] = text
+    new = [(h, seg, text) for (h, seg), text in zip(todo, translated)]
+    if memory and new:
+        memory.put_many(name, source, target, new)
+    known.update((h, text) for h, _, text in new)
+    out = [line if h is None else known[h] for line, h in zip(lines, hashes)]
+    return out, stats
+
+
+def parts_to_docx(parts) -> bytes:
+    """Menyusun hasil terjemahan menjadi .docx: satu paragraf per chunk, page break per halaman."""
+    doc = capabilities.load("docx").Document()
+    for item in "\n\n".join(parts).split('\n\n'):
+        item_stripped = item.strip()
+        if item_stripped == PAGE_BREAK:
+            doc.add_page_break()
+        elif item_stripped:
+            doc.add_paragraph(item_stripped)
+    out = io.BytesIO()
+    doc.save(out)
+    return out.getvalue()